@@ -10,6 +10,7 @@ except ImportError:
 
 import json
 from collections import Counter
+from io import StringIO
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
@@ -17,7 +18,7 @@ from datetime import datetime, time
 
 import yaml
 
-from src.utils.timeutils import load_tz, now_local_date, iso_now_local
+from src.utils.timeutils import RunClock, load_tz, now_local_date, iso_now_local
 from src.utils.io import ensure_dir, write_jsonl, write_text
 from src.utils.dedup import SeenStore
 from src.collectors.rss import collect_rss_items
@@ -29,7 +30,7 @@ from src.collectors.s2_authors import collect_s2_author_items
 from src.collectors.biorxiv_keywords import collect_biorxiv_keyword_items
 from src.processing.rank import rank_and_limit
 from src.processing.script_llm import (
-    build_podcast_script_llm_chunked_with_map,
+    iter_podcast_segments_llm_chunked,
     build_podcast_script_llm_synthesis,
     TRANSITION_MARKER,
 )
@@ -43,7 +44,7 @@ from src.outputs.audio import concat_mp3_with_transitions, _ffprobe_duration_sec
 
 from src.utils.text import clean_for_tts
 
-from src.processing.article_extract import extract_article_text
+from src.processing.article_extract import iter_extract_many
 from src.processing.article_analysis import analyze_article
 from src.outputs.github_publish import upload_episode, push_site
 from src.outputs.notion_publish import save_script_to_notion, save_transcript_to_notion
@@ -243,6 +244,7 @@ def main() -> int:
     _run_errors: List[str] = []   # collect non-fatal errors for Slack report
 
     tz = load_tz(cfg.get("timezone", "Europe/London"))
+    clock = RunClock(tz)
 
     run_date_env = (os.environ.get("RUN_DATE") or "").strip()
     if run_date_env:
@@ -250,8 +252,8 @@ def main() -> int:
         today = run_date_env
         run_anchor = datetime.combine(datetime.fromisoformat(today).date(), time.min, tz)
     else:
-        today = now_local_date(tz)
-        run_anchor = datetime.now(tz)
+        today = now_local_date(tz, clock)
+        run_anchor = clock.started
 
     data_dir = _resolve(repo_dir, cfg["paths"]["data_dir"]) / today
     out_dir = _resolve(repo_dir, cfg["paths"]["output_dir"]) / today
@@ -364,7 +366,7 @@ def main() -> int:
             else:
                 print("[s2_authors] S2_API_KEY not set — skipping", flush=True)
         if cfg.get("daily_knowledge", {}).get("enabled", True):
-            daily_items = collect_daily_knowledge_items(tz=tz)
+            daily_items = collect_daily_knowledge_items(tz=tz, now=clock.now())
             collector_counts["daily_knowledge"] = len(daily_items)
             items.extend(daily_items)
         if cfg.get("wiki_context", {}).get("enabled", False):
@@ -392,6 +394,7 @@ def main() -> int:
         candidates: List[Dict[str, Any]] = []
         new_items: List[Dict[str, Any]] = []
         _run_seen_urls: set = set()
+        _pending: List[Tuple[str, Dict[str, Any]]] = []
         for it in items:
             url = (it.get("url") or "").strip()
             title = (it.get("title") or "")
@@ -411,9 +414,14 @@ def main() -> int:
                 new_items.append(it)
                 continue
 
-            if not DEBUG_MODE and seen.has(url):
-                continue
-            candidates.append(it)
+            _pending.append((url, it))
+
+        # Cross-day dedup in one batch (urls are unique within the run by now)
+        if DEBUG_MODE:
+            candidates = [it for _, it in _pending]
+        else:
+            _unseen = set(seen.filter_unseen([u for u, _ in _pending]))
+            candidates = [it for u, it in _pending if u in _unseen]
 
         # Second pass: parallel article extract + analysis
         max_workers = int(cfg.get("fetch_workers", 8))
@@ -422,10 +430,13 @@ def main() -> int:
 
         _fetch_s2_api_key = os.environ.get("S2_API_KEY", "").strip()
 
-        def _fetch_and_analyze(it: Dict[str, Any]) -> Dict[str, Any]:
+        # Extraction is pure network I/O, so it gets its own wider pool than the
+        # rate-limited LLM analysis; each body is handed to analysis as soon as it lands.
+        extract_workers = int(cfg.get("extract_workers", 16))
+
+        def _analyze(it: Dict[str, Any], body: str) -> Dict[str, Any]:
             url = (it.get("url") or "").strip()
             title = (it.get("title") or "").strip()
-            body = extract_article_text(url)
             # S2 PDF fallback: if primary extraction is thin and we have an S2 API
             # key, resolve the paper ID and attempt to fetch the open-access PDF.
             if len(body) < 500 and _fetch_s2_api_key:
@@ -448,7 +459,12 @@ def main() -> int:
             return it
 
         with ThreadPoolExecutor(max_workers=max_workers) as pool:
-            futures = {pool.submit(_fetch_and_analyze, it): it for it in candidates}
+            futures = {}
+            for _ci, _body in iter_extract_many(
+                [(it.get("url") or "").strip() for it in candidates],
+                max_workers=extract_workers,
+            ):
+                futures[pool.submit(_analyze, candidates[_ci], _body or "")] = candidates[_ci]
             for fut in as_completed(futures):
                 try:
                     new_items.append(fut.result())
@@ -500,10 +516,7 @@ def main() -> int:
     # Mark only ranked (featured) items as seen so runner-up articles remain
     # available for future runs (e.g. weekend episodes with sparse new content).
     if not REGEN_FROM_CACHE:
-        for _it in ranked:
-            _url = (_it.get("url") or "").strip()
-            if _url:
-                seen.add(_url)
+        seen.add_many(u for u in ((_it.get("url") or "").strip() for _it in ranked) if u)
         seen.save()
 
     # 4) Save ranked item list for the website (complete index, not just highlights)
@@ -600,25 +613,48 @@ def main() -> int:
             _traceback.print_exc()
             raise
     else:
+        # Segments stream out in ranked order while later LLM calls are still in
+        # flight; render each one to tts_parts/seg_NNN.mp3 right away so TTS overlaps
+        # LLM decode. The TTS stage below reuses these files (same index/text).
+        _pre_tts = cfg.get("podcast", {}).get("enabled", True)
+        _pre_parts_dir = out_dir / "tts_parts"
+        if _pre_tts:
+            ensure_dir(_pre_parts_dir)
         try:
-            script_text, _item_segments = build_podcast_script_llm_chunked_with_map(date_str=today, items=ranked, cfg=cfg)
+            _segments: List[str] = []
+            for _si, _seg in iter_podcast_segments_llm_chunked(date_str=today, items=ranked, cfg=cfg):
+                _segments.append(_seg)
+                if _pre_tts and _seg:
+                    try:
+                        tts_segment_to_mp3(
+                            text=clean_for_tts(_seg),
+                            out_path=_pre_parts_dir / f"seg_{_si:03d}.mp3",
+                            voice=cfg["podcast"]["voice"],
+                            rate=str(cfg["podcast"].get("voice_rate", "+20%")),
+                        )
+                    except Exception as _tts_err:
+                        # Not fatal here — the TTS stage retries this segment
+                        print(f"[tts] early render of segment {_si} failed — {_tts_err}", flush=True)
+            script_text = f"\n\n{TRANSITION_MARKER}\n\n".join(_segments).strip()
+            _item_segments = list(range(len(ranked)))
         except Exception as _llm_err:
             print(f"[script] FATAL: chunked script generation failed — {_llm_err}", flush=True)
             _traceback.print_exc()
             raise
 
     # Append explicit citations to comprehensive script (for website readers / Spotify notes)
-    refs: List[str] = []
-    refs.append("\n\nReferences:")
+    buf = StringIO()
+    buf.write(script_text.rstrip())
+    buf.write("\n\n\nReferences:")
     for i, it in enumerate(featured_items, 1):
         title = (it.get("title") or "(untitled)").strip()
         src = (it.get("source") or "unknown source").strip()
         url = (it.get("url") or "").strip()
+        buf.write(f"\n[{i}] {title} — {src}")
         if url:
-            refs.append(f"[{i}] {title} — {src} — {url}")
-        else:
-            refs.append(f"[{i}] {title} — {src}")
-    script_text = script_text.rstrip() + "\n" + "\n".join(refs) + "\n"
+            buf.write(f" — {url}")
+    buf.write("\n")
+    script_text = buf.getvalue()
 
     write_text(script_path, script_text)
     script_text_clean = clean_for_tts(script_text)
@@ -761,7 +797,7 @@ def main() -> int:
     source_type_counts = Counter((it.get("source_type") or "unknown").strip() or "unknown" for it in raw_collected_items)
     status = {
         "date": today,
-        "time": iso_now_local(tz),
+        "time": iso_now_local(tz, clock),
         "n_items_raw": len(new_items),
         "n_items_used": len(ranked),
         "lookback_hours": lookback_hours,
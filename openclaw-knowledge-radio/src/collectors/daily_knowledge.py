@@ -1,12 +1,12 @@
 from datetime import datetime
 import requests
-from typing import List, Dict
+from typing import List, Dict, Optional
 
-def collect_daily_knowledge_items(*, tz) -> List[Dict]:
+def collect_daily_knowledge_items(*, tz, now: Optional[datetime] = None) -> List[Dict]:
     items = []
 
     # 1️⃣ On This Day
-    now = datetime.now(tz)
+    now = now or datetime.now(tz)
     mm = f"{now.month:02d}"
     dd = f"{now.day:02d}"
 
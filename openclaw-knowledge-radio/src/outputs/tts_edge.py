@@ -22,6 +22,9 @@ KOKORO_SPEED = float(os.environ.get("KOKORO_SPEED", "1.35"))
 _LAST_TTS_BACKEND = None
 _LAST_TTS_ERROR_SUMMARY = ""
 _TTS_BACKEND_COUNTS: Dict[str, int] = {"edge": 0, "kokoro": 0, "gtts": 0}
+# Backend that rendered each segment file in this process (already counted above),
+# so a later reuse of the same file (early pre-render) reports it instead of the configured one
+_RENDERED_BACKEND: Dict[str, str] = {}
 
 from src.utils.text import chunk_text
 from src.utils.io import ensure_dir
@@ -250,8 +253,13 @@ def tts_segment_to_mp3(
     """
     global _LAST_TTS_BACKEND, _LAST_TTS_ERROR_SUMMARY
     if out_path.exists() and out_path.stat().st_size > _MIN_VALID_MP3_BYTES and _mp3_is_readable(out_path):
-        _LAST_TTS_BACKEND = configured_tts_backend()
-        _TTS_BACKEND_COUNTS[_LAST_TTS_BACKEND] = _TTS_BACKEND_COUNTS.get(_LAST_TTS_BACKEND, 0) + 1
+        rendered = _RENDERED_BACKEND.get(str(out_path))
+        if rendered:
+            _LAST_TTS_BACKEND = rendered
+        else:
+            # Left over from an earlier run; its backend is unknown
+            _LAST_TTS_BACKEND = configured_tts_backend()
+            _TTS_BACKEND_COUNTS[_LAST_TTS_BACKEND] = _TTS_BACKEND_COUNTS.get(_LAST_TTS_BACKEND, 0) + 1
         print(f"[tts] Reusing existing {out_path.name}", flush=True)
         return out_path
 
@@ -263,6 +271,7 @@ def tts_segment_to_mp3(
         if _LAST_TTS_BACKEND == "edge":
             _LAST_TTS_ERROR_SUMMARY = ""
         if out_path.exists() and out_path.stat().st_size > _MIN_VALID_MP3_BYTES:
+            _RENDERED_BACKEND[str(out_path)] = _LAST_TTS_BACKEND
             return out_path
         print(f"[tts] Attempt {attempt}: bad output for {out_path.name} "
               f"({out_path.stat().st_size if out_path.exists() else 0} bytes), retrying...", flush=True)
@@ -282,6 +291,8 @@ def tts_text_to_mp3_chunked(
     - 输出：List[Path]，文件名 part_001.mp3, part_002.mp3...
     额外能力：
     - 若某段生成的 mp3 > 9.5MB，会自动递归拆分文本，直到每个 mp3 <= 9.5MB
+    注意：run_daily 按段调用 tts_segment_to_mp3（不切块），当前流水线不走这里；
+    下面的末尾小块合并只对直接调用本函数的脚本生效。
     """
     ensure_dir(out_dir)
 
@@ -337,6 +348,15 @@ def tts_text_to_mp3_chunked(
     # 初次按 chunk_chars 切
     chunks = chunk_text(text, max_chars=chunk_chars)
 
+    # 末尾的小碎块并入前一块：对本函数的调用者省掉一次 TTS 往返（允许略超 chunk_chars 10%）
+    while (
+        len(chunks) >= 2
+        and len(chunks[-1]) < MIN_SPLIT_CHARS
+        and len(chunks[-2]) + len(chunks[-1]) + 1 <= int(chunk_chars * 1.1)
+    ):
+        tail = chunks.pop()
+        chunks[-1] = chunks[-1] + "\n" + tail
+
     # 逐块生成（每块如果超限会自己继续拆）
     for ch in chunks:
         ch = ch.strip()
@@ -1,8 +1,10 @@
 import hashlib
 import os
+import threading
 import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
+import httpx
 from openai import OpenAI
 try:
     from openai import RateLimitError as _RateLimitError
@@ -13,17 +15,31 @@ except ImportError:
 CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "article_analysis"
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-# Module-level client singleton — created lazily on first use
+# {cache key: path} built with one directory scan on first lookup, so cache
+# checks are dict lookups instead of a stat() per article.
+_CACHE_INDEX: Optional[Dict[str, Path]] = None
+_cache_index_lock = threading.Lock()
+
+# Module-level client singleton — created lazily on first use.
+# analyze_article runs from a thread pool, so creation is guarded by a lock to
+# guarantee exactly one OpenAI/httpx pool per process (keep-alive, one TLS handshake).
 _client: Optional[OpenAI] = None
+_client_lock = threading.Lock()
 
 
 def _get_client() -> OpenAI:
     global _client
     if _client is None:
-        _client = OpenAI(
-            base_url="https://openrouter.ai/api/v1",
-            api_key=os.environ["OPENROUTER_API_KEY"],
-        )
+        with _client_lock:
+            if _client is None:
+                _client = OpenAI(
+                    base_url="https://openrouter.ai/api/v1",
+                    api_key=os.environ["OPENROUTER_API_KEY"],
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+                        timeout=httpx.Timeout(120.0, connect=10.0),
+                    ),
+                )
     return _client
 
 SYSTEM_PROMPT = """
@@ -48,7 +64,59 @@ DEBUG_MODE = os.environ.get("DEBUG", "false").lower() == "true"
 
 
 def hash_url(url: str) -> str:
-    return hashlib.sha1(url.encode()).hexdigest()[:16]
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _legacy_hash_url(url: str) -> str:
+    """Cache key used before the switch to blake2b; still checked so old caches keep hitting."""
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16]
+
+
+def _cache_index() -> Dict[str, Path]:
+    global _CACHE_INDEX
+    if _CACHE_INDEX is None:
+        with _cache_index_lock:
+            if _CACHE_INDEX is None:
+                index: Dict[str, Path] = {}
+                with os.scandir(CACHE_DIR) as it:
+                    for entry in it:
+                        if entry.name.endswith(".txt") and entry.is_file():
+                            index[entry.name[:-4]] = Path(entry.path)
+                _CACHE_INDEX = index
+    return _CACHE_INDEX
+
+
+def _read_cached(url: str) -> Optional[str]:
+    index = _cache_index()
+    key = hash_url(url)
+    path = index.get(key)
+    if path is None:
+        # Migrate a pre-blake2b cache entry in place on first hit
+        legacy = index.get(_legacy_hash_url(url))
+        if legacy is None:
+            return None
+        path = CACHE_DIR / f"{key}.txt"
+        try:
+            legacy.replace(path)
+        except OSError:
+            path = legacy
+        else:
+            with _cache_index_lock:
+                index.pop(_legacy_hash_url(url), None)
+                index[key] = path
+    try:
+        return path.read_bytes().decode("utf-8")
+    except OSError:
+        return None
+
+
+def _write_cached(url: str, analysis: str) -> None:
+    key = hash_url(url)
+    path = CACHE_DIR / f"{key}.txt"
+    path.write_bytes(analysis.encode("utf-8"))
+    index = _cache_index()
+    with _cache_index_lock:
+        index[key] = path
 
 
 def _is_daily_quota(e: Exception) -> bool:
@@ -92,11 +160,11 @@ def analyze_article(
     if not text:
         return ""
 
-    cache_file = CACHE_DIR / f"{hash_url(url)}.txt"
-
     # Cache hit — skip API call entirely
-    if not DEBUG_MODE and cache_file.exists():
-        return cache_file.read_text(encoding="utf-8")
+    if not DEBUG_MODE:
+        cached = _read_cached(url)
+        if cached is not None:
+            return cached
 
     client = _get_client()
     all_models = [model] + (fallback_models or [])
@@ -107,7 +175,7 @@ def analyze_article(
             analysis = _try_one_model(client, m, url, text)
             if m != model:
                 print(f"[analysis] Used fallback model {m!r} (primary {model!r} failed)", flush=True)
-            cache_file.write_text(analysis, encoding="utf-8")
+            _write_cached(url, analysis)
             return analysis
         except Exception as e:
             print(f"[analysis] Model {m!r} failed: {e}", flush=True)
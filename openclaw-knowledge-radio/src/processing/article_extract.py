@@ -1,26 +1,101 @@
 from __future__ import annotations
 
-from typing import Optional
+import hashlib
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from newspaper import Article
 import requests
 from bs4 import BeautifulSoup
 
+# Anchor to the repo root so this works regardless of cwd
+TEXT_CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "article_text"
+TEXT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
-def _extract_with_newspaper(url: str) -> str:
+_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (X11; Linux aarch64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122 Safari/537.36"
+}
+
+
+def _text_cache_path(url: str) -> Path:
+    return TEXT_CACHE_DIR / f"{hashlib.blake2b(url.encode('utf-8'), digest_size=8).hexdigest()}.json"
+
+
+def _load_text_cache(url: str) -> Optional[Dict[str, Any]]:
+    try:
+        entry = json.loads(_text_cache_path(url).read_bytes())
+    except Exception:
+        return None
+    return entry if isinstance(entry, dict) and entry.get("text") else None
+
+
+def _save_text_cache(url: str, etag: str, lm: str, text: str) -> None:
+    path = _text_cache_path(url)
+    tmp = path.with_suffix(".tmp")
+    try:
+        tmp.write_text(json.dumps({"etag": etag, "lm": lm, "text": text}, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _head_validators(url: str, cached: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+    """
+    Conditional HEAD for the page. Returns {"etag", "lm", "not_modified"} or
+    None if the server can't be asked (then we just extract without caching).
+    """
+    headers = dict(_HEADERS)
+    if cached:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("lm"):
+            headers["If-Modified-Since"] = cached["lm"]
+    try:
+        r = requests.head(url, headers=headers, timeout=10, allow_redirects=True)
+    except Exception:
+        return None
+    etag = r.headers.get("ETag", "") or ""
+    lm = r.headers.get("Last-Modified", "") or ""
+    not_modified = bool(cached) and (
+        r.status_code == 304
+        or (r.ok and ((etag and etag == cached.get("etag")) or (lm and lm == cached.get("lm"))))
+    )
+    return {"etag": etag, "lm": lm, "not_modified": not_modified}
+
+
+def _fetch_page(url: str) -> Optional[Dict[str, str]]:
+    """GET the page once. Returns {"html", "etag", "lm"} or None on failure."""
+    try:
+        r = requests.get(url, headers=_HEADERS, timeout=20)
+        r.raise_for_status()
+    except Exception:
+        return None
+    return {
+        "html": r.text,
+        "etag": r.headers.get("ETag", "") or "",
+        "lm": r.headers.get("Last-Modified", "") or "",
+    }
+
+
+def _extract_with_newspaper(url: str, html: Optional[str] = None) -> str:
     article = Article(url)
-    article.download()
+    if html:
+        article.download(input_html=html)
+    else:
+        article.download()
     article.parse()
     return (article.text or "").strip()
 
 
-def _extract_with_bs4(url: str) -> str:
-    headers = {
-        "User-Agent": "Mozilla/5.0 (X11; Linux aarch64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122 Safari/537.36"
-    }
-    r = requests.get(url, headers=headers, timeout=20)
-    r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+def _extract_with_bs4(url: str, html: Optional[str] = None) -> str:
+    if html is None:
+        r = requests.get(url, headers=_HEADERS, timeout=20)
+        r.raise_for_status()
+        html = r.text
+    soup = BeautifulSoup(html, "html.parser")
 
     # Remove noisy tags
     for tag in soup(["script", "style", "noscript", "header", "footer", "nav", "aside"]):
@@ -76,20 +151,40 @@ def extract_article_text(
 
     Falls back to Semantic Scholar open-access PDF if the primary extraction
     yields fewer than 500 characters and s2_paper_id + s2_api_key are provided.
+
+    Web extractions are cached under data/article_text/ with the page's ETag /
+    Last-Modified. Only when a cache entry exists is a conditional HEAD sent
+    first; if it says "unchanged" the cached text is returned without
+    re-downloading or re-parsing. Otherwise the page is fetched once, its
+    validators are taken from that GET, and both extractors parse the same HTML.
     """
+    cached = _load_text_cache(url)
+    if cached:
+        validators = _head_validators(url, cached)
+        if validators and validators["not_modified"]:
+            return cached["text"]
+
+    page = _fetch_page(url)
+    html = page["html"] if page else None
+
+    def _remember(text: str) -> str:
+        if page and (page["etag"] or page["lm"]):
+            _save_text_cache(url, page["etag"], page["lm"], text)
+        return text
+
     # 1) newspaper first (often cleaner)
     try:
-        txt = _extract_with_newspaper(url)
+        txt = _extract_with_newspaper(url, html)
         if len(txt) >= 800:
-            return txt
+            return _remember(txt)
     except Exception:
         pass
 
     # 2) bs4 fallback for paywall-ish / structured pages
     try:
-        txt = _extract_with_bs4(url)
+        txt = _extract_with_bs4(url, html)
         if len(txt) >= 500:
-            return txt
+            return _remember(txt)
     except Exception:
         txt = ""
 
@@ -100,3 +195,24 @@ def extract_article_text(
             return s2_text
 
     return txt
+
+
+def iter_extract_many(urls: List[str], max_workers: int = 16) -> Iterator[Tuple[int, str]]:
+    """
+    Extract article text for many URLs concurrently.
+
+    Download + parse is network-bound (newspaper/lxml release the GIL), so a
+    thread pool overlaps the fetches. Yields (index into urls, text) as each
+    extraction finishes, so callers can start the next stage per article;
+    a failed extraction yields "".
+    """
+    if not urls:
+        return
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(urls)))) as ex:
+        futures = {ex.submit(extract_article_text, u): i for i, u in enumerate(urls)}
+        for fut in as_completed(futures):
+            try:
+                text = fut.result()
+            except Exception:
+                text = ""
+            yield futures[fut], text
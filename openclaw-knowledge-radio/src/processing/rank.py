@@ -1,6 +1,67 @@
+import heapq
 import json
+import re
+from collections import Counter
+from datetime import date as _date
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+try:
+    import orjson as _orjson
+    _json_loads = _orjson.loads  # accepts bytes directly, no intermediate str
+except ImportError:
+    _json_loads = json.loads  # type: ignore[assignment]
+
+
+_FEEDBACK_FILE = Path(__file__).resolve().parent.parent.parent / "state" / "feedback.json"
+_FEEDBACK_WORD_RE = re.compile(r"[a-zA-Z]{5,}")
+_FEEDBACK_STOP = frozenset({
+    "the","a","an","and","or","of","in","for","to","is","are","with","from",
+    "by","on","at","this","that","based","using","via","de","novo","new",
+})
+
+
+@lru_cache(maxsize=4)
+def _load_feedback_cached(path_str: str, mtime_ns: int, halflife_days: float, today_iso: str) -> tuple:
+    """
+    Parse + decay-weight feedback.json. Memoized on (path, mtime, halflife, day),
+    so repeated rank_and_limit calls in one run never re-read an unchanged file.
+    Callers must treat the returned containers as read-only.
+    """
+    today = _date.fromisoformat(today_iso)
+    data = _json_loads(Path(path_str).read_bytes())
+    liked_urls: set = set()
+    liked_sources: Dict[str, float] = {}
+    word_counts: Dict[str, float] = {}
+    for date_key, entries in data.items():
+        # Compute decay weight for this date's entries
+        try:
+            entry_date = _date.fromisoformat(date_key)
+            days_ago = max((today - entry_date).days, 0)
+            weight = 0.5 ** (days_ago / halflife_days)
+        except (ValueError, TypeError):
+            weight = 1.0  # unknown date key → no decay
+        day_words: Counter = Counter()
+        for entry in (entries or []):
+            if isinstance(entry, str):
+                liked_urls.add(entry)
+            elif isinstance(entry, dict):
+                url = (entry.get("url") or "").strip()
+                src = (entry.get("source") or "").strip()
+                title = (entry.get("title") or "").strip()
+                if url:
+                    liked_urls.add(url)
+                if src:
+                    liked_sources[src] = liked_sources.get(src, 0.0) + weight
+                # Extract meaningful title words (length >= 5, not stop words)
+                day_words.update(
+                    w for w in _FEEDBACK_WORD_RE.findall(title.lower()) if w not in _FEEDBACK_STOP
+                )
+        # Every word from the same date shares one weight, so count first, scale once
+        for w, n in day_words.items():
+            word_counts[w] = word_counts.get(w, 0.0) + weight * n
+    return liked_urls, liked_sources, word_counts
 
 
 def _load_feedback(cfg: Dict[str, Any]) -> tuple:
@@ -15,48 +76,17 @@ def _load_feedback(cfg: Dict[str, Any]) -> tuple:
     Recent clicks count fully; clicks from 14 days ago count 50%; 28 days ago → 25%.
     This lets your interests drift naturally — stop clicking a topic and it fades out.
     """
-    import re as _re
-    from datetime import date as _date
-    _STOP = {"the","a","an","and","or","of","in","for","to","is","are","with","from",
-             "by","on","at","this","that","based","using","via","de","novo","new"}
-    state_dir = Path(__file__).resolve().parent.parent.parent / "state"
-    fb_file = state_dir / "feedback.json"
-    if not fb_file.exists():
+    fb_file = _FEEDBACK_FILE
+    try:
+        mtime_ns = fb_file.stat().st_mtime_ns
+    except OSError:
         return set(), {}, {}
 
     r = (cfg.get("ranking") or {}) if isinstance(cfg, dict) else {}
     halflife_days = float(r.get("feedback_halflife_days", 14) or 14)
-    today = _date.today()
 
     try:
-        data = json.loads(fb_file.read_text(encoding="utf-8"))
-        liked_urls: set = set()
-        liked_sources: Dict[str, float] = {}
-        word_counts: Dict[str, float] = {}
-        for date_key, entries in data.items():
-            # Compute decay weight for this date's entries
-            try:
-                entry_date = _date.fromisoformat(date_key)
-                days_ago = max((today - entry_date).days, 0)
-                weight = 0.5 ** (days_ago / halflife_days)
-            except (ValueError, TypeError):
-                weight = 1.0  # unknown date key → no decay
-            for entry in (entries or []):
-                if isinstance(entry, str):
-                    liked_urls.add(entry)
-                elif isinstance(entry, dict):
-                    url = (entry.get("url") or "").strip()
-                    src = (entry.get("source") or "").strip()
-                    title = (entry.get("title") or "").strip()
-                    if url:
-                        liked_urls.add(url)
-                    if src:
-                        liked_sources[src] = liked_sources.get(src, 0.0) + weight
-                    # Extract meaningful title words (length >= 5, not stop words)
-                    for w in _re.findall(r"[a-zA-Z]{5,}", title.lower()):
-                        if w not in _STOP:
-                            word_counts[w] = word_counts.get(w, 0.0) + weight
-        return liked_urls, liked_sources, word_counts
+        return _load_feedback_cached(str(fb_file), mtime_ns, halflife_days, _date.today().isoformat())
     except Exception:
         return set(), {}, {}
 
@@ -111,6 +141,15 @@ def _tags_lower(it: Dict[str, Any]) -> List[str]:
     return [str(t).strip().lower() for t in tags if str(t).strip()]
 
 
+_NEWS_BUCKETS = frozenset({"news"})
+_NEWS_TAGS = frozenset({"news", "science-news", "industry"})
+
+
+def _is_news_source(it: Dict[str, Any]) -> bool:
+    """News bucket or any news-ish tag; subject to max_items_per_news_source."""
+    return it.get("bucket") in _NEWS_BUCKETS or not _NEWS_TAGS.isdisjoint(_tags_lower(it))
+
+
 def _has_fulltext(it: Dict[str, Any], threshold: int) -> bool:
     """
     Keep compatibility with your existing extracted_chars scheme.
@@ -194,38 +233,41 @@ def _absolute_title_priority(it: Dict[str, Any], cfg: Dict[str, Any]) -> int:
     return 1
 
 
-def _journal_quality_priority(it: Dict[str, Any], cfg: Dict[str, Any]) -> int:
-    """
-    Lower is better.
+# Exact-match fast path for the journal feeds in config.yaml (normalized names).
+# Anything not listed here falls through to the substring heuristic below.
+_SOURCE_PRIORITY: Dict[str, int] = {
+    "nature biotechnology": 1,
+    "nature chemical biology": 1,
+    "pnas": 2,
+    "nature (main journal)": 3,
+}
 
-    Rank by trusted sources / journal quality AFTER absolute author feeds.
-    This replaces your previous "fulltext first" dominance.
 
-    Optional override via config:
-      ranking:
-        source_priority_rules:
-          - {contains: "nature biotechnology", priority: 1}
-          - {contains: "nature chemical biology", priority: 1}
-          - {contains: "pnas", priority: 2}
-          - {contains: "nature (main journal)", priority: 2}
-          - {contains: "arxiv", priority: 5}
-          - {contains: "sciencedirect", priority: 6}
-    """
-    src = _norm(it.get("source") or "")
-    tags = _tags_lower(it)
-
-    # Config override (if provided)
+def _priority_rules(cfg: Dict[str, Any]) -> Tuple[Tuple[str, int], ...]:
+    """Normalize ranking.source_priority_rules into a hashable tuple of (contains, priority)."""
     r = (cfg.get("ranking") or {}) if isinstance(cfg, dict) else {}
-    rules = r.get("source_priority_rules") or []
-    for rule in rules:
+    out: List[Tuple[str, int]] = []
+    for rule in (r.get("source_priority_rules") or []):
         try:
             contains = _norm(rule.get("contains", ""))
             pr = int(rule.get("priority"))
         except Exception:
             continue
-        if contains and contains in src:
+        if contains:
+            out.append((contains, pr))
+    return tuple(out)
+
+
+@lru_cache(maxsize=4096)
+def _rule_priority(src: str, rules: Tuple[Tuple[str, int], ...]) -> Optional[int]:
+    """First matching config rule for a normalized source; memoized per unique source."""
+    for contains, pr in rules:
+        if contains in src:
             return pr
+    return None
 
+
+def _fallback_heuristic(src: str, tags: List[str]) -> int:
     # Default heuristic mapping (works with your feed list)
     # 1 = best
     if "nature biotechnology" in src:
@@ -253,6 +295,46 @@ def _journal_quality_priority(it: Dict[str, Any], cfg: Dict[str, Any]) -> int:
     return 7
 
 
+def _journal_quality_priority(
+    it: Dict[str, Any],
+    cfg: Dict[str, Any],
+    rules: Optional[Tuple[Tuple[str, int], ...]] = None,
+) -> int:
+    """
+    Lower is better.
+
+    Rank by trusted sources / journal quality AFTER absolute author feeds.
+    This replaces your previous "fulltext first" dominance.
+
+    Optional override via config:
+      ranking:
+        source_priority_rules:
+          - {contains: "nature biotechnology", priority: 1}
+          - {contains: "nature chemical biology", priority: 1}
+          - {contains: "pnas", priority: 2}
+          - {contains: "nature (main journal)", priority: 2}
+          - {contains: "arxiv", priority: 5}
+          - {contains: "sciencedirect", priority: 6}
+
+    Pass `rules` (from _priority_rules) when calling in a loop so the config
+    is normalized once per ranking pass instead of once per item.
+    """
+    src = _norm(it.get("source") or "")
+
+    # Config override (if provided)
+    if rules is None:
+        rules = _priority_rules(cfg)
+    if rules:
+        pr = _rule_priority(src, rules)
+        if pr is not None:
+            return pr
+
+    pr = _SOURCE_PRIORITY.get(src)
+    if pr is not None:
+        return pr
+    return _fallback_heuristic(src, _tags_lower(it))
+
+
 _BOOST_FILE = Path(__file__).resolve().parent.parent.parent / "state" / "boosted_topics.json"
 
 
@@ -265,7 +347,7 @@ def _missed_paper_keyword_priority(it: Dict[str, Any]) -> int:
     1 otherwise.
     """
     try:
-        missed_kws = json.loads(_BOOST_FILE.read_text(encoding="utf-8")) if _BOOST_FILE.exists() else []
+        missed_kws = _json_loads(_BOOST_FILE.read_bytes()) if _BOOST_FILE.exists() else []
     except Exception:
         missed_kws = []
     if not missed_kws:
@@ -360,6 +442,8 @@ def rank_and_limit(items: List[Dict[str, Any]], cfg: Dict[str, Any]) -> List[Dic
               f"{len(liked_keyword_counts)} keyword(s) "
               f"({', '.join(f'{k}×{n:.1f}' for k,n in top_kws)})", flush=True)
 
+    priority_rules = _priority_rules(cfg)
+
     def rank_key(it: Dict[str, Any]):
         extracted_chars = int(it.get("extracted_chars", 0) or 0)
         has_fulltext = 1 if _has_fulltext(it, FULLTEXT_THRESHOLD) else 0
@@ -376,7 +460,7 @@ def rank_and_limit(items: List[Dict[str, Any]], cfg: Dict[str, Any]) -> List[Dic
             _missed_paper_keyword_priority(it),      # 3) missed paper keywords (user ground truth)
             _feedback_score(it, liked_urls, liked_sources, liked_keyword_counts),  # 4) graded feedback
             _topic_keyword_priority(it, cfg),        # 5) config topic keywords
-            _journal_quality_priority(it, cfg),      # 6) journal quality
+            _journal_quality_priority(it, cfg, priority_rules),  # 6) journal quality
             _bucket_priority(it),                    # 7) research buckets
             s2_score,                                # 8) S2 reference groundedness
             s2_influential,                          # 9) influential citation velocity
@@ -384,52 +468,57 @@ def rank_and_limit(items: List[Dict[str, Any]], cfg: Dict[str, Any]) -> List[Dic
             -extracted_chars,                        # 11) longer text tie-break
         )
 
-    ranked = sorted(items, key=rank_key)
-
     # Per-source caps: named overrides + a default cap for all other news sources
     source_caps: Dict[str, int] = lim.get("source_caps") or {}
     default_news_cap: int = int(lim.get("max_items_per_news_source", 999))
-    _NEWS_BUCKETS = {"news"}
-    _NEWS_TAGS = {"news", "science-news", "industry"}
-
-    def _is_news_source(it: Dict[str, Any]) -> bool:
-        if it.get("bucket") in _NEWS_BUCKETS:
-            return True
-        tags = set(_tags_lower(it))
-        return bool(tags & _NEWS_TAGS)
-
-    source_counts: Dict[str, int] = {}
-    capped: List[Dict[str, Any]] = []
-    for it in ranked:
-        src = (it.get("source") or "").strip()
+    def _source_cap(src: str, it: Dict[str, Any]) -> int:
         if src in source_caps:
-            cap = source_caps[src]
-        elif _is_news_source(it):
-            cap = default_news_cap
-        else:
-            cap = 999
-        count = source_counts.get(src, 0)
-        if count >= cap:
-            continue
-        source_counts[src] = count + 1
-        capped.append(it)
-    ranked = capped
+            return source_caps[src]
+        if _is_news_source(it):
+            return default_news_cap
+        return 999
+
+    # Single keying pass: every item gets its rank key once, grouped by source.
+    # (key, index) pairs keep ties in input order, exactly like a stable sort.
+    by_source: Dict[str, List[Tuple[tuple, int]]] = {}
+    for i, it in enumerate(items):
+        src = (it.get("source") or "").strip()
+        by_source.setdefault(src, []).append((rank_key(it), i))
 
     # Hoist absolute-priority items (tier 0: researcher feeds, tier 1: blogs) to the front
     # so they are never buried behind the protein bucket flood.
     def _is_top_priority(it: Dict[str, Any]) -> bool:
         return _is_researcher_feed(it, cfg) or _is_blog_feed(it)
 
-    top = [it for it in ranked if _is_top_priority(it)]
-    rest = [it for it in ranked if not _is_top_priority(it)]
-
-    # Bucket quotas applied to the remaining items only
-    protein = [x for x in rest if (x.get("bucket") == "protein")]
-    daily = [x for x in rest if (x.get("bucket") == "daily")]
-    others = [x for x in rest if x.get("bucket") not in ("protein", "daily")]
-
-    protein = protein[:max_protein]
-    daily = daily[:max_daily]
-
-    merged = top + protein + others + daily
-    return merged[:max_total]
+    top: List[Tuple[tuple, int]] = []
+    protein: List[Tuple[tuple, int]] = []
+    daily: List[Tuple[tuple, int]] = []
+    others: List[Tuple[tuple, int]] = []
+    for src, keyed in by_source.items():
+        caps = [_source_cap(src, items[i]) for _, i in keyed]
+        if len(keyed) > min(caps):
+            # Cap applies: walk this source's items in rank order, counting kept ones
+            order = sorted(range(len(keyed)), key=keyed.__getitem__)
+            kept: List[Tuple[tuple, int]] = []
+            for j in order:
+                if len(kept) < caps[j]:
+                    kept.append(keyed[j])
+            keyed = kept
+        for entry in keyed:
+            it = items[entry[1]]
+            if _is_top_priority(it):
+                top.append(entry)
+            elif it.get("bucket") == "protein":
+                protein.append(entry)
+            elif it.get("bucket") == "daily":
+                daily.append(entry)
+            else:
+                others.append(entry)
+
+    # Bucket quotas applied to the non-top items only; bounded heaps select
+    # the best K per bucket without sorting the whole candidate list.
+    merged: List[Tuple[tuple, int]] = heapq.nsmallest(max_total, top)
+    merged += heapq.nsmallest(min(max_protein, max(max_total - len(merged), 0)), protein)
+    merged += heapq.nsmallest(max(max_total - len(merged), 0), others)
+    merged += heapq.nsmallest(min(max_daily, max(max_total - len(merged), 0)), daily)
+    return [items[i] for _, i in merged[:max_total]]
@@ -1,8 +1,14 @@
 import os, json, requests
+import asyncio
+import queue
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from io import StringIO
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
+
+from src.utils import llm_cache
 try:
     from openai import RateLimitError as _RateLimitError
 except ImportError:
@@ -24,6 +30,23 @@ def _client_from_config(cfg: Dict[str, Any]) -> OpenAI:
     )
 
 
+def _async_client_from_config(cfg: Dict[str, Any]) -> AsyncOpenAI:
+    api_key_env = cfg.get("llm", {}).get("api_key_env", "OPENROUTER_API_KEY")
+    api_key = os.environ.get(api_key_env)
+    if not api_key:
+        raise RuntimeError(f"Missing env var {api_key_env} for OpenRouter API key")
+    return AsyncOpenAI(
+        base_url="https://openrouter.ai/api/v1",
+        api_key=api_key,
+    )
+
+
+def _cache_ttl_days(cfg: Dict[str, Any]) -> Optional[float]:
+    """llm.cache_ttl_days (default 7); 0 or less disables the LLM output cache."""
+    ttl = float((cfg.get("llm") or {}).get("cache_ttl_days", 7) or 0)
+    return ttl if ttl > 0 else None
+
+
 def _is_daily_quota(e: Exception) -> bool:
     """Return True if this RateLimitError is a hard daily quota exhaustion."""
     s = str(e)
@@ -52,6 +75,23 @@ def _print_quota_reset(e: Exception) -> None:
         print("[llm] Daily free-model quota exhausted — re-run tomorrow.", flush=True)
 
 
+def _build_messages(model: str, system: str, user: str) -> List[Dict[str, Any]]:
+    """
+    Chat messages for one call. Prompts are laid out so the byte-identical part
+    (system prompt, then shared user preamble) comes first and per-call text comes
+    last, which lets providers reuse their prefix cache across calls. Anthropic
+    models via OpenRouter only cache when asked, so mark the system prompt.
+    """
+    if model.startswith("anthropic/"):
+        system_msg: Dict[str, Any] = {
+            "role": "system",
+            "content": [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+        }
+    else:
+        system_msg = {"role": "system", "content": system}
+    return [system_msg, {"role": "user", "content": user}]
+
+
 def _chat_complete_one(
     client: OpenAI,
     *,
@@ -68,10 +108,7 @@ def _chat_complete_one(
         try:
             resp = client.chat.completions.create(
                 model=model,
-                messages=[
-                    {"role": "system", "content": system},
-                    {"role": "user", "content": user},
-                ],
+                messages=_build_messages(model, system, user),
                 temperature=temperature,
                 max_tokens=max_tokens,
             )
@@ -106,8 +143,19 @@ def _chat_complete(
     max_tokens: int,
     retries: int = 3,
     fallback_models: Optional[List[str]] = None,
+    cache_ttl_days: Optional[float] = None,
 ) -> str:
-    """Try `model` first, then each entry in `fallback_models` in order."""
+    """
+    Try `model` first, then each entry in `fallback_models` in order.
+
+    With cache_ttl_days set, identical (system, user, model, temperature) requests
+    are served from data/llm_cache instead of re-calling the API.
+    """
+    key = llm_cache.cache_key(system, user, model, temperature) if cache_ttl_days else ""
+    if key:
+        cached = llm_cache.get(key, cache_ttl_days)
+        if cached is not None:
+            return cached
     all_models = [model] + (fallback_models or [])
     last_err: Optional[Exception] = None
     for m in all_models:
@@ -118,6 +166,100 @@ def _chat_complete(
             )
             if m != model:
                 print(f"[llm] Used fallback model {m!r} (primary {model!r} failed)", flush=True)
+            if key and result:
+                llm_cache.put(key, result)
+            return result
+        except Exception as e:
+            print(f"[llm] Model {m!r} failed: {e}", flush=True)
+            last_err = e
+    raise last_err  # type: ignore[misc]
+
+
+async def _chat_complete_one_async(
+    client: AsyncOpenAI,
+    *,
+    model: str,
+    system: str,
+    user: str,
+    temperature: float,
+    max_tokens: int,
+    retries: int = 3,
+    stream: bool = False,
+) -> str:
+    """
+    Async twin of _chat_complete_one (same retry/backoff policy).
+    With stream=True the reply is consumed as token deltas, so long generations
+    keep the connection active instead of waiting on one large response.
+    """
+    err: Optional[Exception] = None
+    for attempt in range(1, retries + 1):
+        try:
+            resp = await client.chat.completions.create(
+                model=model,
+                messages=_build_messages(model, system, user),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                stream=stream,
+            )
+            if not stream:
+                return (resp.choices[0].message.content or "").strip()
+            parts: List[str] = []
+            async for chunk in resp:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    parts.append(chunk.choices[0].delta.content)
+            return "".join(parts).strip()
+        except _RateLimitError as e:
+            err = e
+            if _is_daily_quota(e):
+                _print_quota_reset(e)
+                raise  # no point retrying
+            wait = 65 * attempt
+            print(f"[llm] 429 on {model} attempt {attempt}/{retries} — waiting {wait}s …", flush=True)
+            if attempt < retries:
+                await asyncio.sleep(wait)
+            else:
+                raise
+        except Exception as e:
+            err = e
+            if attempt < retries:
+                await asyncio.sleep(3 * attempt)
+            else:
+                raise
+    raise err  # pragma: no cover
+
+
+async def _chat_complete_async(
+    client: AsyncOpenAI,
+    *,
+    model: str,
+    system: str,
+    user: str,
+    temperature: float,
+    max_tokens: int,
+    retries: int = 3,
+    fallback_models: Optional[List[str]] = None,
+    stream: bool = False,
+    cache_ttl_days: Optional[float] = None,
+) -> str:
+    """Async twin of _chat_complete: `model` first, then each fallback in order."""
+    key = llm_cache.cache_key(system, user, model, temperature) if cache_ttl_days else ""
+    if key:
+        cached = llm_cache.get(key, cache_ttl_days)
+        if cached is not None:
+            return cached
+    all_models = [model] + (fallback_models or [])
+    last_err: Optional[Exception] = None
+    for m in all_models:
+        try:
+            result = await _chat_complete_one_async(
+                client, model=m, system=system, user=user,
+                temperature=temperature, max_tokens=max_tokens, retries=retries,
+                stream=stream,
+            )
+            if m != model:
+                print(f"[llm] Used fallback model {m!r} (primary {model!r} failed)", flush=True)
+            if key and result:
+                llm_cache.put(key, result)
             return result
         except Exception as e:
             print(f"[llm] Model {m!r} failed: {e}", flush=True)
@@ -136,13 +278,17 @@ def _safe_int(x: Any, default: int = 0) -> int:
         return default
 
 
-def _clip(s: str, n: int) -> str:
-    s = (s or "").strip()
+def _clip_raw(s: str, n: int) -> str:
+    """_clip for text the caller has already stripped (see _item_meta/_analysis_text)."""
     if n <= 0 or len(s) <= n:
         return s
     return s[: max(0, n - 3)] + "..."
 
 
+def _clip(s: str, n: int) -> str:
+    return _clip_raw((s or "").strip(), n)
+
+
 def _chunk(xs: List[Any], n: int) -> List[List[Any]]:
     if n <= 0:
         return [xs]
@@ -160,8 +306,12 @@ def _item_meta(it: Dict[str, Any]) -> Tuple[str, str, str, str, str, int, bool]:
     return title, url, src, bucket, snippet, extracted_chars, has_fulltext
 
 
-def _fulltext_ok(it: Dict[str, Any], threshold_chars: int) -> bool:
-    _, _, _, _, _, extracted_chars, has_fulltext = _item_meta(it)
+def _fulltext_ok(
+    it: Dict[str, Any],
+    threshold_chars: int,
+    meta: Optional[Tuple[str, str, str, str, str, int, bool]] = None,
+) -> bool:
+    _, _, _, _, _, extracted_chars, has_fulltext = meta or _item_meta(it)
     return has_fulltext or (extracted_chars >= threshold_chars)
 
 
@@ -187,52 +337,52 @@ def _analysis_text(it: Dict[str, Any]) -> str:
     return (it.get("one_liner") or it.get("snippet") or "").strip()
 
 
-def _format_item_block(it: Dict[str, Any]) -> str:
-    title, url, src, bucket, snippet, extracted_chars, has_fulltext = _item_meta(it)
+def _format_item_block(
+    it: Dict[str, Any],
+    meta: Optional[Tuple[str, str, str, str, str, int, bool]] = None,
+) -> str:
+    """
+    Per-item context block. Everything here varies per item, so callers must
+    append it AFTER their static instructions (prefix-cache rule: static
+    scaffolding first, variable fields last).
+    """
+    title, url, src, bucket, snippet, extracted_chars, has_fulltext = meta or _item_meta(it)
     tags = it.get("tags") or []
     tags_str = ", ".join([str(t) for t in tags]) if isinstance(tags, list) else str(tags)
 
-    lines: List[str] = []
-    lines.append(f"TITLE: {title}")
-    if src:
-        lines.append(f"SOURCE: {src}")
-    if bucket:
-        lines.append(f"BUCKET: {bucket}")
-    if tags_str:
-        lines.append(f"TAGS: {tags_str}")
-    if url:
-        lines.append(f"URL: {url}")
-    if snippet:
-        lines.append(f"RSS_SNIPPET: {_clip(snippet, 420)}")
-    lines.append(f"EXTRACTED_CHARS: {extracted_chars}")
-    lines.append(f"HAS_FULLTEXT: {has_fulltext}")
+    # Optional lines are "" or carry their own trailing newline
+    src_line = f"SOURCE: {src}\n" if src else ""
+    bucket_line = f"BUCKET: {bucket}\n" if bucket else ""
+    tags_line = f"TAGS: {tags_str}\n" if tags_str else ""
+    url_line = f"URL: {url}\n" if url else ""
+    snippet_line = f"RSS_SNIPPET: {_clip_raw(snippet, 420)}\n" if snippet else ""
     s2_tldr = (it.get("s2_tldr") or "").strip()
-    if s2_tldr:
-        lines.append(f"S2_TLDR: {s2_tldr}")
+    tldr_line = f"S2_TLDR: {s2_tldr}\n" if s2_tldr else ""
 
     notes = _analysis_text(it)
-    if notes:
-        lines.append("NOTES_FROM_PIPELINE:")
-        lines.append(_clip(notes, 40_000))  # large cap — may now contain full PDF text
-    else:
-        lines.append("NOTES_FROM_PIPELINE: (none)")
+    # large cap — may now contain full PDF text
+    notes_block = f"NOTES_FROM_PIPELINE:\n{_clip_raw(notes, 40_000)}" if notes else "NOTES_FROM_PIPELINE: (none)"
 
     # Inject Semantic Scholar related literature if available
+    refs_block = ""
     top_refs: List[Dict] = it.get("s2_top_refs") or []
     if top_refs:
-        lines.append("KEY RELATED LITERATURE (papers this work cites; INFLUENTIAL = this paper builds heavily on it):")
+        refs_block = "\nKEY RELATED LITERATURE (papers this work cites; INFLUENTIAL = this paper builds heavily on it):"
         for ref in top_refs:
             ref_title = ref.get("title") or ""
             ref_year = ref.get("year") or ""
             ref_cites = ref.get("citationCount") or 0
             ref_abstract = ref.get("abstract") or ""
-            influential = ref.get("isInfluential", False)
-            tag = "INFLUENTIAL, " if influential else ""
-            lines.append(f"  [{tag}{ref_cites} citations, {ref_year}] {ref_title}")
+            tag = "INFLUENTIAL, " if ref.get("isInfluential", False) else ""
+            refs_block += f"\n  [{tag}{ref_cites} citations, {ref_year}] {ref_title}"
             if ref_abstract:
-                lines.append(f"    Abstract: {ref_abstract}")
+                refs_block += f"\n    Abstract: {ref_abstract}"
 
-    return "\n".join(lines)
+    return (
+        f"TITLE: {title}\n{src_line}{bucket_line}{tags_line}{url_line}{snippet_line}"
+        f"EXTRACTED_CHARS: {extracted_chars}\nHAS_FULLTEXT: {has_fulltext}\n{tldr_line}"
+        f"{notes_block}{refs_block}"
+    )
 
 
 # =========================
@@ -240,6 +390,8 @@ def _format_item_block(it: Dict[str, Any]) -> str:
 # =========================
 
 TRANSITION_MARKER = "[[TRANSITION]]"
+# Separates per-item segments in a single batched roundup reply
+ROUNDUP_ITEM_SEP = "<<<ITEM_SEP>>>"
 
 SYSTEM_DEEP_DIVE = """You are an expert English podcast host for a long-form run-friendly science/tech show.
 This segment MUST be based ONLY on the provided item block and notes.
@@ -314,55 +466,51 @@ Output in English, TTS-friendly.
 
 def build_podcast_script_llm(*, date_str: str, items: List[Dict[str, Any]], cfg: Dict[str, Any]) -> str:
     """
-    Kept for backwards compatibility (one call). Still English-only.
+    Kept for backwards compatibility: the old single-call script is now the
+    chunked pipeline with every item treated as a roundup (no deep dives), so
+    it shares prompts, client and prefix-cache layout with the main path.
     """
-    client = _client_from_config(cfg)
-    model = cfg["llm"]["model"]
-    temperature = float(cfg["llm"].get("temperature", 0.25))
-    max_tokens = int(cfg["llm"].get("max_output_tokens", 5200))
-
-    blocks = []
-    for i, it in enumerate(items, 1):
-        blocks.append(f"=== ITEM {i} ===\n{_format_item_block(it)}")
-
-    user = (
-        f"DATE: {date_str}\n\n"
-        "Generate an English podcast script ONLY from the items below.\n"
-        "Do not invent details.\n"
-        "Keep it TTS-friendly.\n\n"
-        + "\n\n".join(blocks)
-    )
-
-    # Use roundup prompt style for a single call
-    return _chat_complete(
-        client,
-        model=model,
-        system=SYSTEM_ROUNDUP,
-        user=user,
-        temperature=temperature,
-        max_tokens=max_tokens,
-    ).strip()
+    return asyncio.run(build_podcast_script_llm_chunked_async(
+        date_str=date_str, items=items, cfg=cfg, roundup_only=True,
+    ))
 
 
 # =========================
 # Chunked multi-call version (Deep dive only if fulltext)
 # =========================
 
-def build_podcast_script_llm_chunked(*, date_str: str, items: List[Dict[str, Any]], cfg: Dict[str, Any]) -> str:
+async def build_podcast_script_llm_chunked_async(
+    *,
+    date_str: str,
+    items: List[Dict[str, Any]],
+    cfg: Dict[str, Any],
+    on_segment: Optional[Callable[[int, str], None]] = None,
+    roundup_only: bool = False,
+) -> str:
     """
-    One LLM call per item, in ranked order.
+    One segment per item, in ranked order.
 
     Each item gets its own segment separated by TRANSITION_MARKER so that:
     - segment index i = ranked item i  (item_segments[i] == i)
     - audio order matches website display order
     - clicking highlight [N] always plays item N's SFX + content
 
-    Items with fulltext get a deep-dive treatment (~220-340 words).
-    Items without fulltext get a concise roundup treatment (~80-130 words).
+    Items with fulltext get a deep-dive treatment (~220-340 words), one call each.
+    Items without fulltext get a concise roundup treatment (~80-130 words); all
+    roundup items share ONE call whose reply is split on ROUNDUP_ITEM_SEP
+    (set podcast.chunking.legacy_batches: true for one call per roundup item).
+
+    All calls are issued concurrently (bounded by podcast.chunking.max_concurrency,
+    default 4, to respect provider rate limits); results are written back into
+    ranked positions so assembly is identical to the sequential version.
+
+    on_segment(i, text) is called as soon as segment i is final (in completion
+    order, not ranked order) — see iter_podcast_segments_llm_chunked.
+    roundup_only=True skips deep dives entirely (build_podcast_script_llm).
     """
-    client = _client_from_config(cfg)
     model = cfg["llm"]["model"]
     temperature = float(cfg["llm"].get("temperature", 0.25))
+    max_output_tokens = int(cfg["llm"].get("max_output_tokens", 8192))
 
     podcast_cfg = (cfg.get("podcast") or {})
     chunk_cfg = (podcast_cfg.get("chunking") or {})
@@ -370,49 +518,169 @@ def build_podcast_script_llm_chunked(*, date_str: str, items: List[Dict[str, Any
     fulltext_threshold = int(chunk_cfg.get("fulltext_threshold_chars", 2500))
     deep_max_tokens = int(chunk_cfg.get("deep_dive_max_tokens", 2600))
     roundup_max_tokens = int(chunk_cfg.get("roundup_max_tokens", 2200))
+    max_concurrency = max(1, int(chunk_cfg.get("max_concurrency", 4)))
+    legacy_batches = bool(chunk_cfg.get("legacy_batches", False))
+    stream = bool(chunk_cfg.get("stream", True))
+    cache_ttl_days = _cache_ttl_days(cfg)
 
     ranked = list(items)
-    segments: List[str] = []
-
-    for idx, it in enumerate(ranked, 1):
-        block = _format_item_block(it)
-        if _fulltext_ok(it, fulltext_threshold):
-            user = (
-                f"DATE: {date_str}\n"
-                f"DEEP DIVE #{idx}\n\n"
-                f"{block}\n\n"
-                "Write a deep-dive segment that would take ~6–10 minutes to narrate.\n"
-                "Be strict about what is known vs unknown.\n"
-            )
-            seg = _chat_complete(
+    segments: List[str] = [""] * len(ranked)
+    if not ranked:
+        return ""
+
+    # Parse/format each item once; the per-item roundup fallback reuses the blocks
+    meta_by_id = {id(it): _item_meta(it) for it in ranked}
+    blocks_by_id: Dict[int, str] = {id(it): _format_item_block(it, meta_by_id[id(it)]) for it in ranked}
+
+    deep_idxs: List[int] = []
+    roundup_idxs: List[int] = []
+    for i, it in enumerate(ranked):
+        ok = not roundup_only and _fulltext_ok(it, fulltext_threshold, meta_by_id[id(it)])
+        (deep_idxs if ok else roundup_idxs).append(i)
+
+    client = _async_client_from_config(cfg)
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def limited_call(system: str, user: str, max_tokens: int) -> str:
+        async with sem:
+            seg = await _chat_complete_async(
                 client,
                 model=model,
-                system=SYSTEM_DEEP_DIVE,
+                system=system,
                 user=user,
                 temperature=temperature,
-                max_tokens=deep_max_tokens,
-            ).strip()
-        else:
-            user = (
-                f"DATE: {date_str}\n"
-                f"ITEM #{idx}\n\n"
-                f"{block}\n\n"
-                "Write a concise 80–130 word roundup for this single item. "
-                "Lead with the key finding, mention the source, no sign-off."
+                max_tokens=max_tokens,
+                stream=stream,
+                cache_ttl_days=cache_ttl_days,
             )
-            seg = _chat_complete(
-                client,
-                model=model,
-                system=SYSTEM_ROUNDUP,
-                user=user,
-                temperature=temperature,
-                max_tokens=roundup_max_tokens,
-            ).strip()
-        segments.append(seg)
+            return seg.strip()
+
+    def _done(i: int, text: str) -> None:
+        segments[i] = text
+        if on_segment is not None:
+            on_segment(i, text)
+
+    # Prompt layout for prefix caching: the run-constant preamble comes first and is
+    # byte-identical across calls of the same kind; item blocks and per-call
+    # labels (VARIANT footer) go last.
+    deep_preamble = (
+        f"DATE: {date_str}\n\n"
+        "Write a deep-dive segment that would take ~6–10 minutes to narrate.\n"
+        "Be strict about what is known vs unknown.\n\n"
+    )
+    roundup_preamble = (
+        f"DATE: {date_str}\n\n"
+        "Write a concise 80–130 word roundup for this single item. "
+        "Lead with the key finding, mention the source, no sign-off.\n\n"
+    )
+    batch_preamble = (
+        f"DATE: {date_str}\n\n"
+        "Write a concise 80–130 word roundup for EACH item below, in order. "
+        "Lead with the key finding, mention the source, no sign-off.\n"
+        f"Separate consecutive segments with a line containing only {ROUNDUP_ITEM_SEP} "
+        "— no item numbers or headings.\n\n"
+    )
+
+    async def deep_dive(i: int) -> None:
+        user = (
+            deep_preamble
+            + f"{blocks_by_id[id(ranked[i])]}\n\n"
+            + f"VARIANT: DEEP DIVE #{i + 1}\n"
+        )
+        _done(i, await limited_call(SYSTEM_DEEP_DIVE, user, deep_max_tokens))
+
+    async def roundup_one(i: int) -> None:
+        user = (
+            roundup_preamble
+            + f"{blocks_by_id[id(ranked[i])]}\n\n"
+            + f"VARIANT: ITEM #{i + 1}\n"
+        )
+        _done(i, await limited_call(SYSTEM_ROUNDUP, user, roundup_max_tokens))
+
+    async def roundup_batch(idxs: List[int]) -> None:
+        blocks = "\n\n".join(
+            f"=== ITEM {k} ===\n{blocks_by_id[id(ranked[i])]}" for k, i in enumerate(idxs, 1)
+        )
+        user = (
+            batch_preamble
+            + f"{blocks}\n\n"
+            + f"VARIANT: ROUNDUP BATCH — output exactly {len(idxs)} segments.\n"
+        )
+        max_tokens = min(roundup_max_tokens * len(idxs), max(max_output_tokens, roundup_max_tokens))
+        reply = await limited_call(SYSTEM_ROUNDUP, user, max_tokens)
+        parts = [x.strip() for x in reply.split(ROUNDUP_ITEM_SEP)]
+        parts = [x for x in parts if x]
+        if len(parts) != len(idxs):
+            # Model merged/skipped items — redo this tier one call per item
+            print(f"[llm] Roundup batch returned {len(parts)}/{len(idxs)} segments — "
+                  "falling back to per-item calls", flush=True)
+            await asyncio.gather(*(roundup_one(i) for i in idxs))
+            return
+        for i, part in zip(idxs, parts):
+            _done(i, part)
+
+    jobs = [deep_dive(i) for i in deep_idxs]
+    if roundup_idxs:
+        if legacy_batches or len(roundup_idxs) == 1:
+            jobs += [roundup_one(i) for i in roundup_idxs]
+        else:
+            jobs.append(roundup_batch(roundup_idxs))
+
+    try:
+        await asyncio.gather(*jobs)
+    finally:
+        await client.close()
 
     return f"\n\n{TRANSITION_MARKER}\n\n".join(segments).strip()
 
 
+def build_podcast_script_llm_chunked(*, date_str: str, items: List[Dict[str, Any]], cfg: Dict[str, Any]) -> str:
+    """Sync wrapper around build_podcast_script_llm_chunked_async."""
+    return asyncio.run(build_podcast_script_llm_chunked_async(date_str=date_str, items=items, cfg=cfg))
+
+
+def iter_podcast_segments_llm_chunked(
+    *, date_str: str, items: List[Dict[str, Any]], cfg: Dict[str, Any]
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (segment_index, segment_text) in ranked order as soon as each segment
+    and all segments before it are ready, while later LLM calls are still running.
+
+    Lets the caller start TTS on early segments instead of waiting for the whole
+    script. Joining the yielded texts with TRANSITION_MARKER (exactly as
+    build_podcast_script_llm_chunked does) reproduces its return value.
+    """
+    q: "queue.Queue[Optional[Tuple[int, str]]]" = queue.Queue()
+    failure: List[BaseException] = []
+
+    def _run() -> None:
+        try:
+            asyncio.run(build_podcast_script_llm_chunked_async(
+                date_str=date_str, items=items, cfg=cfg,
+                on_segment=lambda i, text: q.put((i, text)),
+            ))
+        except BaseException as e:  # re-raised in the consumer thread
+            failure.append(e)
+        finally:
+            q.put(None)
+
+    worker = threading.Thread(target=_run, name="llm-chunked", daemon=True)
+    worker.start()
+    ready: Dict[int, str] = {}
+    next_i = 0
+    while True:
+        msg = q.get()
+        if msg is None:
+            break
+        ready[msg[0]] = msg[1]
+        while next_i in ready:
+            yield next_i, ready.pop(next_i)
+            next_i += 1
+    worker.join()
+    if failure:
+        raise failure[0]
+
+
 def build_podcast_script_llm_chunked_with_map(
     *, date_str: str, items: List[Dict[str, Any]], cfg: Dict[str, Any]
 ) -> tuple:
@@ -589,11 +857,6 @@ def build_podcast_script_llm_synthesis(
     # Per-section token budget — 700 tokens ≈ 350 words ≈ ~2.5 min narration (11 sections ≈ 30 min)
     section_max_tokens = int(podcast_cfg.get("synthesis_section_max_tokens", 700))
 
-    # Build shared paper context block (reused across all section calls)
-    blocks: List[str] = []
-    for i, it in enumerate(items, 1):
-        blocks.append(f"=== PAPER {i} ===\n{_format_item_block(it)}")
-    papers_block = "\n\n".join(blocks)
 
     landscape_block = ""
     if shared_landscape:
@@ -626,14 +889,16 @@ def build_podcast_script_llm_synthesis(
                 lines.append(f"    Abstract: {rec_abstract}")
         recommendations_block = "\n".join(lines) + "\n\n"
 
-    header = (
-        f"DATE: {date_str}\n\n"
-        + landscape_block
-        + recommendations_block
-        + f"TODAY'S FEATURED PAPERS ({len(items)} papers):\n\n"
-        + papers_block
-        + "\n\n"
-    )
+    # Shared context header (reused across all section calls), written in one pass
+    buf = StringIO()
+    buf.write(f"DATE: {date_str}\n\n{landscape_block}{recommendations_block}")
+    buf.write(f"TODAY'S FEATURED PAPERS ({len(items)} papers):\n\n")
+    for i, it in enumerate(items, 1):
+        if i > 1:
+            buf.write("\n\n")
+        buf.write(f"=== PAPER {i} ===\n{_format_item_block(it)}")
+    buf.write("\n\n")
+    header = buf.getvalue()
 
     sections: List[str] = []
     for idx, (title, instruction) in enumerate(_SYNTHESIS_SECTIONS, 1):
@@ -658,6 +923,7 @@ def build_podcast_script_llm_synthesis(
             temperature=temperature,
             max_tokens=section_max_tokens,
             fallback_models=fallback_models,
+            cache_ttl_days=_cache_ttl_days(cfg),
         ).strip()
         sections.append(seg)
 
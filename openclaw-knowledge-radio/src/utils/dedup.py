@@ -3,28 +3,111 @@ from __future__ import annotations
 import hashlib
 import json
 from pathlib import Path
-from typing import Set
+from typing import Iterable, List, Set
+
+# seen_ids.bin record width: a sha1 hex id; blake2b ids are right-padded with spaces
+SEEN_BIN_WIDTH = 40
 
 
 def _url_id(url: str) -> str:
-    return hashlib.sha1(url.strip().encode("utf-8")).hexdigest()
+    """Dedup id for an already-stripped URL (24 hex chars)."""
+    return hashlib.blake2b(url.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def _legacy_url_id(url: str) -> str:
+    """Pre-blake2b id (40-hex sha1) still present in older seen_ids.json files."""
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+
+def _url_ids_bulk(urls: Iterable[str]) -> List[str]:
+    """_url_id over a whole batch of already-stripped URLs in one comprehension."""
+    h = hashlib.blake2b
+    return [h(u.encode("utf-8"), digest_size=12).hexdigest() for u in urls]
 
 
 class SeenStore:
+    """
+    seen_ids.json is a sorted JSON snapshot; ids added since the last compaction
+    are appended one per line to seen_ids.log, so save() writes only the delta.
+    Each compaction also writes seen_ids.bin, the same snapshot as sorted
+    fixed-width records that readers can binary-search in place (mmap).
+    """
+
+    # Fold the append log back into the snapshot once it grows past this many lines
+    COMPACT_AFTER = 2000
+
     def __init__(self, path: Path):
         self.path = path
+        self.log_path = path.with_suffix(".log")
+        self.bin_path = path.with_suffix(".bin")
         self.ids: Set[str] = set()
+        self._dirty: Set[str] = set()
+        self._log_lines = 0
         if path.exists():
             try:
-                self.ids = set(json.loads(path.read_text(encoding="utf-8")))
+                self.ids = set(json.loads(path.read_bytes()))
             except Exception:
                 self.ids = set()
+        if self.log_path.exists():
+            try:
+                lines = self.log_path.read_text(encoding="utf-8").splitlines()
+                self._log_lines = len(lines)
+                self.ids.update(x for x in lines if x)
+            except Exception:
+                pass
+        # Only pay for the second hash while sha1 ids are still on disk
+        self._has_legacy = any(len(x) == 40 for x in self.ids)
 
     def has(self, url: str) -> bool:
-        return _url_id(url) in self.ids
+        url = url.strip()
+        if _url_id(url) in self.ids:
+            return True
+        return self._has_legacy and _legacy_url_id(url) in self.ids
+
+    def filter_unseen(self, urls: List[str]) -> List[str]:
+        """The subset of (already-stripped) urls not yet seen, in input order."""
+        ids = self.ids
+        unseen = [u for u, uid in zip(urls, _url_ids_bulk(urls)) if uid not in ids]
+        if self._has_legacy:
+            unseen = [u for u in unseen if _legacy_url_id(u) not in ids]
+        return unseen
+
+    def add_many(self, urls: Iterable[str]) -> None:
+        for uid in _url_ids_bulk(urls):
+            if uid not in self.ids:
+                self.ids.add(uid)
+                self._dirty.add(uid)
 
     def add(self, url: str) -> None:
-        self.ids.add(_url_id(url))
+        uid = _url_id(url.strip())
+        if uid not in self.ids:
+            self.ids.add(uid)
+            self._dirty.add(uid)
 
     def save(self) -> None:
-        self.path.write_text(json.dumps(sorted(self.ids)), encoding="utf-8")
+        if (
+            not self.path.exists()
+            or not self.bin_path.exists()
+            or self._log_lines + len(self._dirty) > self.COMPACT_AFTER
+        ):
+            self.compact()
+            return
+        if not self._dirty:
+            return
+        with self.log_path.open("a", encoding="utf-8") as f:
+            f.write("\n".join(sorted(self._dirty)) + "\n")
+        self._log_lines += len(self._dirty)
+        self._dirty.clear()
+
+    def compact(self) -> None:
+        """Rewrite the full snapshot and drop the append log."""
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        tmp.write_text(json.dumps(sorted(self.ids)), encoding="utf-8")
+        tmp.replace(self.path)
+        records = sorted(x.ljust(SEEN_BIN_WIDTH) for x in self.ids if len(x) <= SEEN_BIN_WIDTH)
+        tmp = self.bin_path.with_name(self.bin_path.name + ".tmp")
+        tmp.write_bytes("".join(records).encode("ascii"))
+        tmp.replace(self.bin_path)
+        self.log_path.unlink(missing_ok=True)
+        self._log_lines = 0
+        self._dirty.clear()
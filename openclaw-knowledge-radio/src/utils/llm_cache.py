@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+# Content-addressable store: data/llm_cache/<hash[:2]>/<hash>.txt
+# (pruned after 30 days by the daily workflow, like data/article_analysis)
+CACHE_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "llm_cache"
+
+
+def cache_key(system: str, user: str, model: str, temperature: float) -> str:
+    h = hashlib.blake2b(digest_size=32)
+    h.update(f"{system}\x1e{user}\x1e{model}|{temperature}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _path(key: str) -> Path:
+    return CACHE_DIR / key[:2] / f"{key}.txt"
+
+
+def get(key: str, ttl_days: Optional[float] = None) -> Optional[str]:
+    """Cached text for key, or None. Entries older than ttl_days are evicted on read."""
+    path = _path(key)
+    try:
+        if ttl_days is not None and ttl_days > 0:
+            if time.time() - path.stat().st_mtime > ttl_days * 86400:
+                path.unlink(missing_ok=True)
+                return None
+        return path.read_bytes().decode("utf-8")
+    except OSError:
+        return None
+
+
+def put(key: str, text: str) -> None:
+    path = _path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(text.encode("utf-8"))
+        os.replace(tmp, path)  # atomic: readers never see a half-written entry
+    except OSError:
+        pass
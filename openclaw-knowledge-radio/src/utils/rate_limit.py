@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+
+class RateLimiter:
+    """
+    At most `rate` calls in flight and at most `rate` starts per `per` seconds,
+    shared by all threads (semaphore + sliding window of start times).
+
+        limit = RateLimiter(rate=3, per=1.0)
+        with limit:
+            session.post(...)
+    """
+
+    def __init__(self, rate: int = 3, per: float = 1.0):
+        self.rate = rate
+        self.per = per
+        self._slots = threading.Semaphore(rate)
+        self._lock = threading.Lock()
+        self._starts: deque = deque(maxlen=rate)
+
+    def __enter__(self) -> "RateLimiter":
+        self._slots.acquire()
+        with self._lock:
+            if len(self._starts) == self.rate:
+                delay = self._starts[0] + self.per - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            self._starts.append(time.monotonic())
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._slots.release()
@@ -3,7 +3,22 @@ from __future__ import annotations
 import re
 from typing import List
 
+from src.utils import text_numba
+
 _sentence_end = re.compile(r"([.!?。！？])")
+# Buffers at least this long go through the compiled kernel when numba is installed
+_NUMBA_MIN_CHARS = 200_000
+
+_URL_RE = re.compile(r"https?://\S+")
+# One pass for both: [title](url) keeps title, bare url is dropped
+_LINK_OR_URL_RE = re.compile(r"\[([^\]]+)\]\((?:https?://[^\)]+)\)|https?://\S+")
+# Trailing blanks before a newline, or a run of 3+ (possibly blank-padded) newlines
+_WS_CLEAN_RE = re.compile(r"(?P<run>[ \t]*\n(?:[ \t]*\n){2,})|[ \t]+\n")
+_CUT_KEYWORDS_RE = re.compile("来源清单|Sources list|Sources:|References:")
+# Markdown heading / emphasis / bullet markers that TTS would read literally
+_HEADING_RE = re.compile(r"^\s{0,3}#{1,6}\s*", re.MULTILINE)
+_MARKERS_RE = re.compile(r"[*_`~]{1,3}")
+_BULLET_RE = re.compile(r"^\s*[-*+]\s+", re.MULTILINE)
 
 
 def chunk_text(text: str, max_chars: int) -> List[str]:
@@ -11,22 +26,30 @@ def chunk_text(text: str, max_chars: int) -> List[str]:
     if not text:
         return []
     chunks: List[str] = []
-    buf = ""
+    # Current buffer as its stripped lines + joined length; joined only when flushed
+    lines: List[str] = []
+    buf_len = 0
 
     for line in text.splitlines():
         add = line.strip()
+        # blank lines don't take chunk budget (they'd be stripped off the buffer end)
         if not add:
-            add = ""
-        # keep paragraph breaks, but don't waste chunk budget
-        candidate = (buf + "\n" + add).strip() if buf else add
-        if len(candidate) <= max_chars:
-            buf = candidate
+            candidate_len = buf_len
+        elif lines:
+            candidate_len = buf_len + 1 + len(add)
         else:
-            chunks.extend(_split_buf(buf, max_chars))
-            buf = add
+            candidate_len = len(add)
+        if candidate_len <= max_chars:
+            if add:
+                lines.append(add)
+            buf_len = candidate_len
+        else:
+            chunks.extend(_split_buf("\n".join(lines), max_chars))
+            lines = [add] if add else []
+            buf_len = len(add)
 
-    if buf.strip():
-        chunks.extend(_split_buf(buf, max_chars))
+    if lines:
+        chunks.extend(_split_buf("\n".join(lines), max_chars))
 
     return [c.strip() for c in chunks if c.strip()]
 
@@ -38,20 +61,38 @@ def _split_buf(buf: str, max_chars: int) -> List[str]:
     if len(buf) <= max_chars:
         return [buf]
 
+    if text_numba.HAVE_NUMBA and len(buf) >= _NUMBA_MIN_CHARS:
+        parts = [p for p in (buf[s:e].strip() for s, e in text_numba.split_spans(buf, max_chars)) if p]
+        return _hard_wrap(parts, max_chars)
+
+    # Token boundaries fall on both sides of every sentence-end char; the current
+    # part is tracked as a [start, end) span of buf and sliced out on flush.
     parts = []
-    cur = ""
-    for token in _sentence_end.split(buf):
-        if not token:
+    start = end = 0
+    pos = 0
+    bounds: List[int] = []
+    for m in _sentence_end.finditer(buf):
+        bounds.append(m.start())
+        bounds.append(m.end())
+    bounds.append(len(buf))
+    for b in bounds:
+        if b == pos:
             continue
-        if len(cur) + len(token) <= max_chars:
-            cur += token
+        if (end - start) + (b - pos) <= max_chars:
+            end = b
         else:
-            if cur.strip():
-                parts.append(cur.strip())
-            cur = token
-    if cur.strip():
-        parts.append(cur.strip())
-
+            p = buf[start:end].strip()
+            if p:
+                parts.append(p)
+            start, end = pos, b
+        pos = b
+    p = buf[start:end].strip()
+    if p:
+        parts.append(p)
+    return _hard_wrap(parts, max_chars)
+
+
+def _hard_wrap(parts: List[str], max_chars: int) -> List[str]:
     out: List[str] = []
     for p in parts:
         if len(p) <= max_chars:
@@ -61,10 +102,11 @@ def _split_buf(buf: str, max_chars: int) -> List[str]:
                 out.append(p[i:i+max_chars])
     return out
 
-import re
 
-_URL_RE = re.compile(r"https?://\S+")
-_MD_LINK_RE = re.compile(r"\[([^\]]+)\]\((https?://[^\)]+)\)")
+def _link_or_url(m: "re.Match[str]") -> str:
+    title = m.group(1)
+    return _URL_RE.sub("", title) if title else ""
+
 
 def clean_for_tts(text: str) -> str:
     """
@@ -77,27 +119,20 @@ def clean_for_tts(text: str) -> str:
     if not text:
         return ""
 
-    # [title](url) -> title
-    text = _MD_LINK_RE.sub(r"\1", text)
-
-    # remove raw urls
-    text = _URL_RE.sub("", text)
+    # [title](url) -> title, and remove raw urls
+    text = _LINK_OR_URL_RE.sub(_link_or_url, text)
 
     # remove markdown heading/bullet/strong markers frequently spoken by TTS
-    text = re.sub(r"^\s{0,3}#{1,6}\s*", "", text, flags=re.MULTILINE)
-    text = re.sub(r"[*_`~]{1,3}", "", text)
-    text = re.sub(r"^\s*[-*+]\s+", "", text, flags=re.MULTILINE)
+    text = _HEADING_RE.sub("", text)
+    text = _MARKERS_RE.sub("", text)
+    text = _BULLET_RE.sub("", text)
 
     # OPTIONAL: drop trailing sources section if you keep one
     # adjust these keywords to your script style
-    cut_keywords = ["来源清单", "Sources list", "Sources:", "References:"]
-    for kw in cut_keywords:
-        idx = text.find(kw)
-        if idx != -1:
-            text = text[:idx].rstrip()
-            break
+    m = _CUT_KEYWORDS_RE.search(text)
+    if m:
+        text = text[:m.start()].rstrip()
 
     # cleanup excessive spaces / blank lines
-    text = re.sub(r"[ \t]+\n", "\n", text)
-    text = re.sub(r"\n{3,}", "\n\n", text)
+    text = _WS_CLEAN_RE.sub(lambda m: "\n\n" if m.group("run") else "\n", text)
     return text.strip()
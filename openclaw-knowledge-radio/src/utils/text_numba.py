@@ -0,0 +1,91 @@
+"""
+Optional Numba kernel for text._split_buf on very large buffers.
+
+The greedy sentence packing runs over a uint32 codepoint array and returns raw
+[start, end) spans; the caller strips/filters them exactly like the pure-Python
+path. Without numba (not in requirements.txt) split_spans() falls back to the
+same loop in Python, so results never depend on whether it is installed.
+"""
+from __future__ import annotations
+
+from typing import List, Tuple
+
+_ENDS = ".!?。！？"
+
+try:
+    import numpy as np
+    from numba import njit
+
+    _ENDS_MASK = np.zeros(0x10000, dtype=np.uint8)
+    for _c in _ENDS:
+        _ENDS_MASK[ord(_c)] = 1
+
+    @njit(cache=True)
+    def chunk_offsets(codepoints, max_chars, ends_mask):
+        """Flat [s0, e0, s1, e1, ...] spans of the greedy sentence packing."""
+        n = codepoints.shape[0]
+        out = np.empty(2 * (2 * n + 2), dtype=np.int64)
+        k = 0
+        start = 0
+        end = 0
+        pos = 0
+        for i in range(n + 1):
+            # token boundaries: both sides of every sentence-end char, and the end
+            if i < n:
+                cp = codepoints[i]
+                if cp >= 0x10000 or ends_mask[cp] == 0:
+                    continue
+                marks = (i, i + 1)
+            else:
+                marks = (n, n)
+            for b in marks:
+                if b == pos:
+                    continue
+                if (end - start) + (b - pos) <= max_chars:
+                    end = b
+                else:
+                    out[k] = start
+                    out[k + 1] = end
+                    k += 2
+                    start = pos
+                    end = b
+                pos = b
+        out[k] = start
+        out[k + 1] = end
+        k += 2
+        return out[:k]
+
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def _split_spans_py(buf: str, max_chars: int) -> List[Tuple[int, int]]:
+    spans: List[Tuple[int, int]] = []
+    start = end = pos = 0
+    bounds: List[int] = []
+    for i, ch in enumerate(buf):
+        if ch in _ENDS:
+            bounds.append(i)
+            bounds.append(i + 1)
+    bounds.append(len(buf))
+    for b in bounds:
+        if b == pos:
+            continue
+        if (end - start) + (b - pos) <= max_chars:
+            end = b
+        else:
+            spans.append((start, end))
+            start, end = pos, b
+        pos = b
+    spans.append((start, end))
+    return spans
+
+
+def split_spans(buf: str, max_chars: int) -> List[Tuple[int, int]]:
+    """Raw [start, end) spans of buf packed greedily at sentence ends (unstripped)."""
+    if not HAVE_NUMBA:
+        return _split_spans_py(buf, max_chars)
+    cps = np.frombuffer(buf.encode("utf-32-le"), dtype=np.uint32)
+    flat = chunk_offsets(cps, max_chars, _ENDS_MASK).tolist()
+    return list(zip(flat[0::2], flat[1::2]))
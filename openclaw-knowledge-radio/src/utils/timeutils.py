@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import time
 from datetime import datetime, timedelta
+from typing import Optional
 from zoneinfo import ZoneInfo
 
 
@@ -8,12 +10,28 @@ def load_tz(tz_name: str) -> ZoneInfo:
     return ZoneInfo(tz_name)
 
 
-def now_local_date(tz: ZoneInfo) -> str:
-    return datetime.now(tz).date().isoformat()
+class RunClock:
+    """
+    Wall clock read (and TZ-localized) once at run start; later now() calls are
+    that anchor plus monotonic elapsed time, so no further clock/TZ work per call.
+    The UTC offset stays the start one — fine for a run that lasts minutes.
+    """
 
+    def __init__(self, tz: ZoneInfo):
+        self.tz = tz
+        self.started = datetime.now(tz)
+        self._mono0 = time.monotonic_ns()
 
-def iso_now_local(tz: ZoneInfo) -> str:
-    return datetime.now(tz).isoformat(timespec="seconds")
+    def now(self) -> datetime:
+        return self.started + timedelta(microseconds=(time.monotonic_ns() - self._mono0) // 1000)
+
+
+def now_local_date(tz: ZoneInfo, clock: Optional[RunClock] = None) -> str:
+    return (clock.now() if clock is not None else datetime.now(tz)).date().isoformat()
+
+
+def iso_now_local(tz: ZoneInfo, clock: Optional[RunClock] = None) -> str:
+    return (clock.now() if clock is not None else datetime.now(tz)).isoformat(timespec="seconds")
 
 
 def cutoff_datetime(tz: ZoneInfo, lookback_hours: int, now_dt: datetime | None = None) -> datetime:
@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import os
 import random
+import re
 from pathlib import Path
 from datetime import datetime, timezone
 import html
@@ -25,6 +26,8 @@ MISSED_FILE      = Path(os.environ.get("MISSED_FILE",      str(_PACKAGE_DIR / "s
 OWNER_ALERT_FILE = Path(os.environ.get("OWNER_ALERT_FILE", str(_PACKAGE_DIR / "state" / "site_alert.json")))
 TRANSCRIPT_INDEX = Path(os.environ.get("TRANSCRIPT_INDEX", str(_PACKAGE_DIR / "state" / "transcript_notion_index.json")))
 
+_SENTENCE_END_RE = re.compile(r'[.!?](?:\s|$)')
+
 
 def _load_notes() -> dict:
     """Load paper_notes.json → {date: {url: note_text}}.
@@ -114,8 +117,7 @@ def _load_release_index() -> dict:
 
 def _first_sentence(text: str) -> str:
     """Return only the first sentence of text."""
-    import re
-    m = re.search(r'[.!?](?:\s|$)', text)
+    m = _SENTENCE_END_RE.search(text)
     return text[:m.start() + 1].strip() if m else text
 
 
@@ -156,7 +158,6 @@ def _format_transcript_html(text: str) -> str:
     Convert raw script text to readable HTML for the transcript panel.
     [[TRANSITION]] markers become visible section dividers.
     """
-    import re as _re
     sections = text.split("[[TRANSITION]]")
     parts = []
     for i, sec in enumerate(sections, 1):
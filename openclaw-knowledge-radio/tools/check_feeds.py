@@ -2,12 +2,16 @@
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 import requests
 import feedparser
+from requests.adapters import HTTPAdapter
+
+MAX_WORKERS = 16
 
 
 def load_cfg() -> Dict[str, Any]:
@@ -17,9 +21,39 @@ def load_cfg() -> Dict[str, Any]:
     return yaml.safe_load(cfg_path.read_text(encoding="utf-8"))
 
 
-def fetch(url: str, timeout: int = 25) -> Tuple[int, str, str]:
+def make_session() -> requests.Session:
+    """One pooled session shared by all workers (keep-alive, no per-feed TLS handshake)."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def load_etags(path: Path) -> Dict[str, Dict[str, str]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+def save_etags(path: Path, etags: Dict[str, Dict[str, str]]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(etags, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+    tmp.replace(path)
+
+
+def fetch(
+    url: str,
+    timeout: int = 25,
+    session: Optional[requests.Session] = None,
+    validators: Optional[Dict[str, str]] = None,
+) -> Tuple[int, str, str, Dict[str, str]]:
     """
-    Returns (status_code, final_url, text_prefix)
+    Returns (status_code, final_url, text_prefix, new_validators)
+
+    validators ({"etag", "last_modified"} from a previous OK check) are sent as
+    If-None-Match / If-Modified-Since; a 304 comes back with an empty prefix.
     """
     headers = {
         "User-Agent": (
@@ -31,9 +65,19 @@ def fetch(url: str, timeout: int = 25) -> Tuple[int, str, str]:
         "Cache-Control": "no-cache",
         "Pragma": "no-cache",
     }
-    r = requests.get(url, headers=headers, timeout=timeout, allow_redirects=True)
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    r = (session or requests).get(url, headers=headers, timeout=timeout, allow_redirects=True)
+    if r.status_code == 304:
+        return 304, str(r.url), "", dict(validators or {})
+    new_validators = {
+        k: v for k, v in (("etag", r.headers.get("ETag")), ("last_modified", r.headers.get("Last-Modified"))) if v
+    }
     txt = r.text or ""
-    return r.status_code, str(r.url), txt[:4000]
+    return r.status_code, str(r.url), txt[:4000], new_validators
 
 
 def is_probably_xml(text_prefix: str) -> bool:
@@ -41,6 +85,80 @@ def is_probably_xml(text_prefix: str) -> bool:
     return t.startswith("<?xml") or t.startswith("<rss") or t.startswith("<feed") or t.startswith("<rdf")
 
 
+def fetch_one(
+    i: int,
+    f: Dict[str, Any],
+    out_dir: Path,
+    session: requests.Session,
+    etags: Dict[str, Dict[str, str]],
+) -> Dict[str, Any]:
+    """
+    Check one feed. etags holds validators for feeds that were OK last time;
+    each worker only touches its own url key.
+    """
+    name = f.get("name", f"feed_{i}")
+    url = f.get("url")
+    row: Dict[str, Any] = {"name": name, "url": url}
+    t0 = time.time()
+    try:
+        status, final_url, prefix, validators = fetch(url, session=session, validators=etags.get(url))
+        row["status"] = status
+        row["final_url"] = final_url
+        if status == 304:
+            # Unchanged since a check that passed — skip parsing, keep the old head sample
+            row["ok"] = True
+            row["not_modified"] = True
+            row["elapsed_s"] = round(time.time() - t0, 3)
+            return row
+        row["looks_xml"] = is_probably_xml(prefix)
+
+        parsed = feedparser.parse(prefix if row["looks_xml"] else prefix)
+        entries = parsed.entries or []
+        row["n_entries_in_payload"] = len(entries)
+
+        # take a few titles
+        sample = []
+        for e in entries[:3]:
+            title = (e.get("title") or "").strip()
+            link = (e.get("link") or "").strip()
+            if title or link:
+                sample.append({"title": title[:120], "link": link[:200]})
+        row["sample"] = sample
+
+        if status == 200 and len(entries) > 0 and row["looks_xml"]:
+            row["ok"] = True
+            if validators:
+                etags[url] = validators
+            else:
+                etags.pop(url, None)
+        else:
+            row["ok"] = False
+            etags.pop(url, None)
+            # helpful hint
+            if status in (401, 403):
+                row["hint"] = "blocked (401/403). likely WAF/Cloudflare. consider alternate feed or a fetch service."
+            elif status in (301, 302, 307, 308):
+                row["hint"] = "redirect. check final_url and whether it is actually XML."
+            elif status == 200 and not row["looks_xml"]:
+                row["hint"] = "returned HTML not XML. RSS link may be wrong or blocked."
+            elif status == 200 and row["looks_xml"] and len(entries) == 0:
+                row["hint"] = "XML but zero entries in sampled payload. could be truncated preview; try fetching full body."
+            else:
+                row["hint"] = "unknown; inspect saved prefix for clues."
+
+        # save prefix for debugging
+        safe_name = "".join(c if c.isalnum() else "_" for c in name)[:60]
+        (out_dir / f"{i:02d}_{safe_name}.head.txt").write_text(prefix, encoding="utf-8", errors="ignore")
+
+    except Exception as e:
+        row["ok"] = False
+        row["error"] = repr(e)
+        etags.pop(url, None)
+
+    row["elapsed_s"] = round(time.time() - t0, 3)
+    return row
+
+
 def main() -> None:
     cfg = load_cfg()
     feeds: List[Dict[str, Any]] = cfg.get("rss_sources", []) or cfg.get("feeds", []) or []
@@ -51,70 +169,31 @@ def main() -> None:
     out_dir = Path("output") / "feed_health"
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    report = []
-    ok_count = 0
+    # Filled by feed position so report.json keeps config order
+    report: List[Optional[Dict[str, Any]]] = [None] * len(feeds)
 
     print(f"Checking {len(feeds)} feeds...\n")
 
-    for i, f in enumerate(feeds, start=1):
-        name = f.get("name", f"feed_{i}")
-        url = f.get("url")
-        if not url:
-            report.append({"name": name, "url": None, "ok": False, "error": "missing url"})
-            continue
-
-        row: Dict[str, Any] = {"name": name, "url": url}
-        t0 = time.time()
-        try:
-            status, final_url, prefix = fetch(url)
-            row["status"] = status
-            row["final_url"] = final_url
-            row["looks_xml"] = is_probably_xml(prefix)
-
-            parsed = feedparser.parse(prefix if row["looks_xml"] else prefix)
-            entries = parsed.entries or []
-            row["n_entries_in_payload"] = len(entries)
-
-            # take a few titles
-            sample = []
-            for e in entries[:3]:
-                title = (e.get("title") or "").strip()
-                link = (e.get("link") or "").strip()
-                if title or link:
-                    sample.append({"title": title[:120], "link": link[:200]})
-            row["sample"] = sample
-
-            if status == 200 and len(entries) > 0 and row["looks_xml"]:
-                row["ok"] = True
-                ok_count += 1
-            else:
-                row["ok"] = False
-                # helpful hint
-                if status in (401, 403):
-                    row["hint"] = "blocked (401/403). likely WAF/Cloudflare. consider alternate feed or a fetch service."
-                elif status in (301, 302, 307, 308):
-                    row["hint"] = "redirect. check final_url and whether it is actually XML."
-                elif status == 200 and not row["looks_xml"]:
-                    row["hint"] = "returned HTML not XML. RSS link may be wrong or blocked."
-                elif status == 200 and row["looks_xml"] and len(entries) == 0:
-                    row["hint"] = "XML but zero entries in sampled payload. could be truncated preview; try fetching full body."
-                else:
-                    row["hint"] = "unknown; inspect saved prefix for clues."
-
-            # save prefix for debugging
-            safe_name = "".join(c if c.isalnum() else "_" for c in name)[:60]
-            (out_dir / f"{i:02d}_{safe_name}.head.txt").write_text(prefix, encoding="utf-8", errors="ignore")
-
-        except Exception as e:
-            row["ok"] = False
-            row["error"] = repr(e)
-
-        row["elapsed_s"] = round(time.time() - t0, 3)
-        report.append(row)
-
-        status_str = row.get("status", "ERR")
-        ok_str = "OK" if row["ok"] else "FAIL"
-        print(f"{i:02d}. {ok_str} [{status_str}] {name} -> {row.get('final_url', url)}")
+    etags_path = out_dir / "etags.json"
+    etags = load_etags(etags_path)
+
+    session = make_session()
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        futures = {}
+        for i, f in enumerate(feeds, start=1):
+            if not f.get("url"):
+                report[i - 1] = {"name": f.get("name", f"feed_{i}"), "url": None, "ok": False, "error": "missing url"}
+                continue
+            futures[ex.submit(fetch_one, i, f, out_dir, session, etags)] = i
+        for fut in as_completed(futures):
+            i = futures[fut]
+            row = fut.result()
+            report[i - 1] = row
+            status_str = row.get("status", "ERR")
+            ok_str = "OK" if row["ok"] else "FAIL"
+            print(f"{i:02d}. {ok_str} [{status_str}] {row['name']} -> {row.get('final_url', row['url'])}")
+    ok_count = sum(1 for row in report if row and row["ok"])
+    save_etags(etags_path, etags)
 
     out_path = out_dir / "report.json"
     out_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
@@ -1,24 +1,66 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
-import tempfile
+import os
+import subprocess
 from pathlib import Path
 
-import soundfile as sf
+import numpy as np
+import onnxruntime as ort
 from fastapi import FastAPI, HTTPException
-from fastapi.responses import Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 from kokoro_onnx import Kokoro
-import subprocess
+
+# In-process MP3 encoding; without it we pipe PCM through ffmpeg instead
+try:
+    import lameenc
+except ImportError:
+    lameenc = None
 
 BASE = Path('/home/eva/openclaw_workspace/openclaw_podcast/openclaw-knowledge-radio')
 MODEL = BASE / 'models' / 'kokoro' / 'kokoro-v1.0.onnx'
+MODEL_INT8 = BASE / 'models' / 'kokoro' / 'kokoro-v1.0.int8.onnx'
 VOICES = BASE / 'models' / 'kokoro' / 'voices-v1.0.bin'
+MP3_BITRATE_KBPS = 128
+# Samples per encoder call when streaming (~0.7 s at 24 kHz)
+STREAM_WINDOW = 16384
+# Dynamic INT8 weights: ~half the bytes moved per inference on CPU. KOKORO_INT8=0 keeps FP32.
+USE_INT8 = os.getenv('KOKORO_INT8', '1').strip().lower() not in ('0', 'false', 'no')
 
 if not MODEL.exists() or not VOICES.exists():
     raise RuntimeError('Kokoro model files missing')
 
-kokoro = Kokoro(str(MODEL), str(VOICES))
+
+def _model_path() -> Path:
+    if not USE_INT8:
+        return MODEL
+    if not MODEL_INT8.exists():
+        try:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+            print(f'[kokoro] Quantizing {MODEL.name} -> {MODEL_INT8.name} (one-off)...', flush=True)
+            quantize_dynamic(str(MODEL), str(MODEL_INT8), weight_type=QuantType.QInt8)
+        except Exception as e:
+            print(f'[kokoro] INT8 quantization failed ({e}); using FP32 model', flush=True)
+            MODEL_INT8.unlink(missing_ok=True)
+            return MODEL
+    return MODEL_INT8
+
+
+def _load_kokoro() -> Kokoro:
+    model = _model_path()
+    if not hasattr(Kokoro, 'from_session'):
+        # Older kokoro_onnx can't take our session; default session options
+        return Kokoro(str(model), str(VOICES))
+    opts = ort.SessionOptions()
+    opts.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    opts.intra_op_num_threads = os.cpu_count() or 1
+    session = ort.InferenceSession(str(model), sess_options=opts, providers=['CPUExecutionProvider'])
+    return Kokoro.from_session(session, str(VOICES))
+
+
+kokoro = _load_kokoro()
 
 app = FastAPI(title='Kokoro Local TTS API')
 
@@ -32,30 +74,85 @@ class TTSReq(BaseModel):
     stream: bool = False
 
 
+def _to_pcm16(audio) -> bytes:
+    return (np.clip(audio, -1.0, 1.0) * 32767).astype('<i2').tobytes()
+
+
+def _new_encoder(sr: int):
+    encoder = lameenc.Encoder()
+    encoder.set_bit_rate(MP3_BITRATE_KBPS)
+    encoder.set_in_sample_rate(int(sr))
+    encoder.set_channels(1)
+    encoder.set_quality(2)
+    return encoder
+
+
+def _encode_mp3(audio, sr: int) -> bytes:
+    pcm = _to_pcm16(audio)
+    if lameenc is not None:
+        encoder = _new_encoder(sr)
+        return bytes(encoder.encode(pcm) + encoder.flush())
+    cmd = [
+        'ffmpeg', '-y', '-f', 's16le', '-ar', str(int(sr)), '-ac', '1', '-i', 'pipe:0',
+        '-codec:a', 'libmp3lame', '-q:a', '4', '-f', 'mp3', 'pipe:1',
+    ]
+    p = subprocess.run(cmd, input=pcm, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if p.returncode != 0 or not p.stdout:
+        raise RuntimeError('ffmpeg mp3 encode failed')
+    return p.stdout
+
+
+async def _iter_mp3(text: str, voice: str, speed: float):
+    """Yield MP3 frames as audio is synthesized (kokoro create_stream) or windowed."""
+    encoder = None
+
+    def frames(audio, sr: int):
+        nonlocal encoder
+        if encoder is None:
+            encoder = _new_encoder(sr)
+        for start in range(0, len(audio), STREAM_WINDOW):
+            data = bytes(encoder.encode(_to_pcm16(audio[start:start + STREAM_WINDOW])))
+            if data:
+                yield data
+
+    if hasattr(kokoro, 'create_stream'):
+        async for audio, sr in kokoro.create_stream(text, voice=voice, speed=speed, lang='en-gb'):
+            for data in frames(audio, sr):
+                yield data
+    else:
+        audio, sr = await run_in_threadpool(kokoro.create, text, voice=voice, speed=speed, lang='en-gb')
+        for data in frames(audio, sr):
+            yield data
+    if encoder is not None:
+        tail = bytes(encoder.flush())
+        if tail:
+            yield tail
+
+
 @app.get('/health')
 def health():
     return {'ok': True}
 
 
 @app.post('/v1/audio/speech')
-def speech(req: TTSReq):
+async def speech(req: TTSReq):
     text = (req.input or '').strip()
     if not text:
         raise HTTPException(status_code=400, detail='empty input')
+    if req.stream and lameenc is not None:
+        # Errors after the first frame can only end the stream early, not set a 500
+        return StreamingResponse(_iter_mp3(text, req.voice, float(req.speed)), media_type='audio/mpeg')
+    # Synthesis and encoding are CPU-bound; keep them off the event loop so
+    # concurrent requests overlap instead of queueing behind each other.
     try:
-        audio, sr = kokoro.create(text, voice=req.voice, speed=float(req.speed), lang='en-gb')
+        audio, sr = await run_in_threadpool(
+            kokoro.create, text, voice=req.voice, speed=float(req.speed), lang='en-gb'
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f'kokoro create failed: {e}')
-
-    with tempfile.TemporaryDirectory() as td:
-        td = Path(td)
-        wav = td / 'out.wav'
-        mp3 = td / 'out.mp3'
-        sf.write(str(wav), audio, sr)
-        cmd = ['ffmpeg', '-y', '-i', str(wav), '-codec:a', 'libmp3lame', '-q:a', '4', str(mp3)]
-        p = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        if p.returncode != 0 or not mp3.exists():
-            raise HTTPException(status_code=500, detail='ffmpeg mp3 encode failed')
-        data = mp3.read_bytes()
+    try:
+        data = await run_in_threadpool(_encode_mp3, audio, sr)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f'mp3 encode failed: {e}')
 
     return Response(content=data, media_type='audio/mpeg')
@@ -8,21 +8,52 @@ from its title to boost similar papers in future rankings.
 Reads:   state/missed_papers.json
 Writes:  state/missed_papers.json  (marks entries as processed + diagnosis)
          state/boosted_topics.json (accumulates extracted keywords)
+         state/llm_keyword_cache.json (LLM keywords by normalized title)
 
-Uses only stdlib + PyYAML.  No extra deps.
+Uses only stdlib + PyYAML + requests (both installed by the workflow) and the
+package's src/utils/rate_limit.py; orjson/jiter are used when available.
 """
 from __future__ import annotations
 
+import bisect
+import codecs
 import hashlib
 import json
+import mmap
 import os
 import re
+import sys
 import urllib.parse
-import urllib.request
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Container, Dict, List, Optional, Set, Tuple
 
+import requests
 import yaml
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# libyaml-backed loader when PyYAML was built with it; same safe subset either way
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Partial JSON parsing of LLM replies (tolerates trailing prose / truncation)
+try:
+    import jiter
+except ImportError:
+    jiter = None
+
+# tools/ runs as a script; put the package root on sys.path for shared src.utils helpers
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.utils.rate_limit import RateLimiter  # noqa: E402
 
 PACKAGE_DIR = Path(__file__).resolve().parent.parent
 STATE_DIR   = PACKAGE_DIR / "state"
@@ -31,7 +62,63 @@ CONFIG_FILE = PACKAGE_DIR / "config.yaml"
 MISSED_FILE    = STATE_DIR / "missed_papers.json"
 BOOST_FILE     = STATE_DIR / "boosted_topics.json"
 SEEN_FILE      = STATE_DIR / "seen_ids.json"
+SEEN_LOG       = STATE_DIR / "seen_ids.log"
+SEEN_BIN       = STATE_DIR / "seen_ids.bin"
 EXTRA_RSS_FILE = STATE_DIR / "extra_rss_sources.json"
+KW_CACHE_FILE  = STATE_DIR / "llm_keyword_cache.json"
+
+# Concurrent blocking calls per phase; Notion calls are also paced by _NOTION_LIMIT
+MAX_WORKERS        = 16
+NOTION_MAX_WORKERS = 3
+
+
+def _load_json(path: Path, default: Any) -> Any:
+    """Parse a state file straight from bytes; default if missing or unreadable."""
+    if not path.exists():
+        return default
+    try:
+        raw = path.read_bytes()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        return default
+
+
+def _dump_json(path: Path, obj: Any) -> None:
+    """Write via a tmp file + os.replace so a killed run never leaves a half-written state file."""
+    # Same layout either way: 2-space indent, non-ASCII kept as-is
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _make_session(retries: int) -> requests.Session:
+    """Keep-alive pool shared by every worker thread (one TLS handshake per host)."""
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503],
+        # urllib3's default idempotent set: a POST/PATCH that got a 502 may already
+        # have created a Notion page or been billed by OpenRouter, so never re-send it
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+    ) if retries else 0
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# GETs/HEADs retry transient 429/502/503 (POST/PATCH never do); feed probes don't —
+# a dead domain should cost one timeout, not four
+_SESSION       = _make_session(retries=3)
+_PROBE_SESSION = _make_session(retries=0)
+
+# Notion's public API allows ~3 requests/second per integration
+_NOTION_LIMIT = RateLimiter(rate=3, per=1.0)
 
 # Domains that host articles from many sources — not informative for RSS check
 _PASSTHROUGH_DOMAINS = {"doi.org", "pubmed.ncbi.nlm.nih.gov", "ncbi.nlm.nih.gov"}
@@ -39,11 +126,20 @@ _PASSTHROUGH_DOMAINS = {"doi.org", "pubmed.ncbi.nlm.nih.gov", "ncbi.nlm.nih.gov"
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# Pure functions of the URL, hit repeatedly per paper (diagnose, discovery, extra_rss checks); memoized
+@lru_cache(maxsize=2048)
 def _sha1(url: str) -> str:
-    """Matches SeenStore hash in src/utils/dedup.py exactly."""
+    """Matches SeenStore legacy hash (_legacy_url_id) in src/utils/dedup.py exactly."""
     return hashlib.sha1(url.strip().encode("utf-8")).hexdigest()
 
 
+@lru_cache(maxsize=2048)
+def _url_id(url: str) -> str:
+    """Matches SeenStore hash (_url_id) in src/utils/dedup.py exactly."""
+    return hashlib.blake2b(url.strip().encode("utf-8"), digest_size=12).hexdigest()
+
+
+@lru_cache(maxsize=2048)
 def _domain(url: str) -> str:
     try:
         return urllib.parse.urlparse(url).netloc.lower().lstrip("www.")
@@ -61,17 +157,64 @@ def _rss_domains(cfg: Dict[str, Any]) -> Set[str]:
     return domains
 
 
+class _SeenBin:
+    """
+    Read-only view of seen_ids.bin (written by SeenStore.compact in
+    src/utils/dedup.py): sorted 40-byte records, shorter ids space-padded.
+    Membership is a binary search over the mmap, so nothing is parsed up front.
+    """
+
+    WIDTH = 40
+
+    def __init__(self, path: Path, extra: Set[str]):
+        self._extra = extra  # ids from seen_ids.log, not yet compacted
+        self._mm: Any = b""
+        if path.stat().st_size:
+            with path.open("rb") as f:
+                self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        return len(self._mm) // self.WIDTH
+
+    def __getitem__(self, i: int) -> bytes:
+        w = self.WIDTH
+        return self._mm[i * w:(i + 1) * w]
+
+    def __contains__(self, uid: object) -> bool:
+        if not isinstance(uid, str) or len(uid) > self.WIDTH:
+            return False
+        if uid in self._extra:
+            return True
+        key = uid.ljust(self.WIDTH).encode("ascii")
+        i = bisect.bisect_left(self, key)
+        return i < len(self) and self[i] == key
+
+
+def _load_seen_ids() -> Container[str]:
+    """seen_ids.bin (+ log) when SeenStore has written it, else the JSON snapshot (+ log)."""
+    logged: Set[str] = set()
+    # Ids appended since SeenStore last compacted the snapshot
+    if SEEN_LOG.exists():
+        logged.update(x for x in SEEN_LOG.read_text(encoding="utf-8").splitlines() if x)
+    if SEEN_BIN.exists():
+        try:
+            return _SeenBin(SEEN_BIN, logged)
+        except (OSError, ValueError):
+            pass
+    return logged.union(_load_json(SEEN_FILE, []))
+
+
 # ── Diagnosis ─────────────────────────────────────────────────────────────────
 
 def diagnose(
     entry: Dict[str, Any],
-    seen_ids: Set[str],
+    seen_ids: Container[str],
     rss_domains: Set[str],
-    excluded_terms: List[str],
+    excluded_terms_lower: List[str],
 ) -> str:
     """
     Return one of:
-      "already_collected"  — sha1(url) found in seen_ids.json
+      "already_collected"  — url id (blake2b, or legacy sha1) found in seen_ids.json
       "excluded_term"      — a configured excluded_term appears in the title
       "source_not_in_rss"  — URL domain not in any RSS source
       "low_ranking"        — was fetchable but ranked below the item cap
@@ -80,13 +223,12 @@ def diagnose(
     title = (entry.get("title") or "").strip().lower()
 
     # 1. Already collected?
-    if url and _sha1(url) in seen_ids:
+    if url and (_url_id(url) in seen_ids or _sha1(url) in seen_ids):
         return "already_collected"
 
-    # 2. Excluded by term filter?
-    for term in (excluded_terms or []):
-        if term.lower() in title:
-            return "excluded_term"
+    # 2. Excluded by term filter? (terms are lowercased once by the caller)
+    if any(t in title for t in excluded_terms_lower):
+        return "excluded_term"
 
     # 3. Source not in RSS?
     if url:
@@ -100,31 +242,66 @@ def diagnose(
 
 # ── LLM keyword extraction ────────────────────────────────────────────────────
 
-_STOP_WORDS = {
+_STOP_WORDS = frozenset({
     "the", "a", "an", "and", "or", "of", "in", "for", "to", "is", "are",
     "with", "from", "by", "on", "at", "this", "that", "based", "using",
     "via", "de", "novo", "new", "using", "through", "into", "its",
-}
+})
+
+_TITLE_WORD_RE   = re.compile(r"[a-z]+")
+_KEYWORD_WORD_RE = re.compile(r"[a-z]{5,}")  # title is lowered first, so == [a-zA-Z]{5,}
 
 def _heuristic_keywords(title: str) -> List[str]:
     """Extract meaningful words from title as a fallback."""
-    words = re.findall(r"[a-zA-Z]{5,}", title.lower())
-    seen: Set[str] = set()
     kws: List[str] = []
-    for w in words:
-        if w not in _STOP_WORDS and w not in seen:
-            seen.add(w)
+    # Lazy scan: stops reading the title as soon as 5 keywords are found
+    for m in _KEYWORD_WORD_RE.finditer(title.lower()):
+        w = m.group()
+        if w not in _STOP_WORDS and w not in kws:
             kws.append(w)
-        if len(kws) >= 5:
-            break
+            if len(kws) == 5:
+                break
     return kws
 
 
-def extract_keywords_llm(title: str, api_key: str) -> List[str]:
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _parse_json_array(text: str) -> Optional[List[Any]]:
+    """The JSON array starting at the first '[' in text (prose after it is ignored), or None."""
+    idx = text.find("[")
+    if idx < 0:
+        return None
+    try:
+        if jiter is not None:
+            # partial_mode also keeps the complete items of a reply cut off by max_tokens
+            val = jiter.from_json(text[idx:].encode("utf-8"), partial_mode=True)
+        else:
+            val, _ = _JSON_DECODER.raw_decode(text, idx)
+    except ValueError:
+        return None
+    return val if isinstance(val, list) else None
+
+
+def _title_key(title: str) -> str:
+    """Cache key that ignores case, punctuation and word order."""
+    words = sorted(_TITLE_WORD_RE.findall(title.lower()))
+    return hashlib.sha1(" ".join(words).encode("utf-8")).hexdigest()
+
+
+def extract_keywords_llm(
+    title: str, api_key: str, cache: Optional[Dict[str, List[str]]] = None
+) -> List[str]:
     """
     Call OpenRouter to extract 3-5 lowercase topic keywords from a paper title.
-    Falls back to heuristic extraction on any failure.
+    Falls back to heuristic extraction on any failure. LLM results are looked
+    up in / stored into cache (keyed by _title_key) when one is given.
     """
+    key = _title_key(title)
+    if cache is not None and key in cache:
+        print(f"[process_missed] Cached keywords: {cache[key]}")
+        return list(cache[key])
+
     if not api_key:
         print("[process_missed] No API key — using heuristic keyword extraction.")
         return _heuristic_keywords(title)
@@ -137,37 +314,36 @@ def extract_keywords_llm(title: str, api_key: str) -> List[str]:
         "Example output: [\"protein binder\", \"diffusion model\", \"antibody design\"]"
     )
 
-    payload = json.dumps({
+    payload = {
         "model": "arcee-ai/trinity-large-preview:free",
         "messages": [{"role": "user", "content": prompt}],
         "max_tokens": 128,
         "temperature": 0.2,
-    }).encode("utf-8")
-
-    req = urllib.request.Request(
-        "https://openrouter.ai/api/v1/chat/completions",
-        data=payload,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/WenyueDai/openclaw_podcast",
-            "X-Title": "openclaw-knowledge-radio",
-        },
-        method="POST",
-    )
+    }
 
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            body = json.loads(resp.read().decode("utf-8"))
+        resp = _SESSION.post(
+            "https://openrouter.ai/api/v1/chat/completions",
+            json=payload,
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "HTTP-Referer": "https://github.com/WenyueDai/openclaw_podcast",
+                "X-Title": "openclaw-knowledge-radio",
+            },
+            timeout=30,
+        )
+        resp.raise_for_status()
+        body = resp.json()
         text = body["choices"][0]["message"]["content"].strip()
         # Extract JSON array from response (may have surrounding text)
-        m = re.search(r'\[.*?\]', text, re.DOTALL)
-        if m:
-            kws = json.loads(m.group())
+        kws = _parse_json_array(text)
+        if kws:
             # Validate: list of strings
             result = [str(k).strip().lower() for k in kws if isinstance(k, str) and k.strip()]
             if result:
                 print(f"[process_missed] LLM keywords: {result}")
+                if cache is not None:
+                    cache[key] = result[:5]
                 return result[:5]
     except Exception as exc:
         print(f"[process_missed] LLM call failed ({exc}), using heuristic fallback.")
@@ -195,19 +371,54 @@ _FEED_CONTENT_TYPES = {
     "application/xml",
     "text/xml",
 }
+# Body bytes _probe_url asks for (Range) and sniffs
+_PROBE_BYTES = 512
+_FEED_ROOTS = (b"<rss", b"<feed", b"<rdf:rdf", b"<atom")
+
+
+def _looks_like_feed(head: bytes) -> bool:
+    """True if a response body prefix opens like an RSS/Atom/RDF document."""
+    head = head.lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+    if head.startswith(_FEED_ROOTS):
+        return True
+    # An XML declaration alone could be any XML; require a feed root in the prefix
+    return head.startswith(b"<?xml") and any(root in head for root in _FEED_ROOTS)
+
+
+# <link rel="alternate" type="application/(rss|atom)+xml" href="..."> with the
+# attributes in any order: rel/type are lookaheads, so there's one scan instead of
+# one per attribute order. [^>]{0,512} bounds backtracking inside a single tag.
+_FEED_LINK_RE = re.compile(
+    r'<link(?=[^>]{0,512}?\brel=["\']alternate["\'])'
+    r'(?=[^>]{0,512}?\btype=["\']application/(?:rss|atom)\+xml["\'])'
+    r'[^>]{0,512}?\bhref=["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+
+
+_HTML_CHUNK     = 4096
+_HTML_MAX_BYTES = 65536
+_TAG_OVERLAP    = 2048
 
 
 def _probe_url(url: str, timeout: int = 8) -> tuple[bool, str]:
     """
-    HEAD-then-GET a URL.  Returns (is_feed, final_url).
-    is_feed=True if content-type looks like XML/RSS/Atom.
+    Ranged GET of the first _PROBE_BYTES of a URL.  Returns (is_feed, final_url).
+    is_feed=True if content-type looks like XML/RSS/Atom, or the body starts
+    like a feed (servers often send feeds as text/html or text/plain, and some
+    answer HEAD differently from GET).
     """
+    headers = {"User-Agent": "FeedProbe/1.0", "Range": f"bytes=0-{_PROBE_BYTES - 1}"}
     try:
-        req = urllib.request.Request(url, method="HEAD", headers={"User-Agent": "FeedProbe/1.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as r:
+        with _PROBE_SESSION.get(url, headers=headers, timeout=timeout, stream=True) as r:
+            if not r.ok:  # 206, or 200 from servers that ignore Range
+                return False, ""
             ct = r.headers.get("Content-Type", "").lower().split(";")[0].strip()
             if any(ft in ct for ft in _FEED_CONTENT_TYPES):
                 return True, r.url
+            head = r.raw.read(_PROBE_BYTES, decode_content=True) or b""
+            if _looks_like_feed(head):
+                return True, r.url
     except Exception:
         pass
     return False, ""
@@ -219,28 +430,26 @@ def _extract_feed_from_html(url: str, timeout: int = 10) -> str:
     Returns the discovered feed URL, or "".
     """
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "FeedProbe/1.0"})
-        with urllib.request.urlopen(req, timeout=timeout) as r:
-            # Read up to 64 KB — the <head> section is always near the top
-            raw = r.read(65536).decode("utf-8", errors="ignore")
-        # Look for RSS/Atom link tags
-        for m in re.finditer(
-            r'<link[^>]+rel=["\']alternate["\'][^>]+'
-            r'type=["\']application/(rss|atom)\+xml["\'][^>]*href=["\']([^"\']+)["\']',
-            raw, re.IGNORECASE
-        ):
-            href = m.group(2).strip()
-            if href:
-                return urllib.parse.urljoin(url, href)
-        # Also try reversed attribute order (href before type)
-        for m in re.finditer(
-            r'<link[^>]+href=["\']([^"\']+)["\'][^>]+'
-            r'type=["\']application/(rss|atom)\+xml["\']',
-            raw, re.IGNORECASE
-        ):
-            href = m.group(1).strip()
-            if href:
-                return urllib.parse.urljoin(url, href)
+        with _PROBE_SESSION.get(url, headers={"User-Agent": "FeedProbe/1.0"}, timeout=timeout, stream=True) as r:
+            r.raise_for_status()
+            # Read 4 KB at a time, up to 64 KB — the <head> section is always near the
+            # top, so stop at the first feed link or at </head>. Leaving the with-block
+            # early closes the socket instead of draining the rest of the page.
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+            raw = ""
+            n_bytes = 0
+            for chunk in r.iter_content(_HTML_CHUNK):
+                n_bytes += len(chunk)
+                # Re-scan a little of the previous text in case a tag straddles chunks
+                start = max(0, len(raw) - _TAG_OVERLAP)
+                raw += decoder.decode(chunk)
+                # Look for RSS/Atom link tags (first one in document order)
+                for m in _FEED_LINK_RE.finditer(raw, start):
+                    href = m.group(1).strip()
+                    if href:
+                        return urllib.parse.urljoin(url, href)
+                if "</head>" in raw[start:].lower() or n_bytes >= _HTML_MAX_BYTES:
+                    break
     except Exception:
         pass
     return ""
@@ -260,25 +469,29 @@ def discover_rss_feed(paper_url: str) -> str:
         print(f"[process_missed] Feed found via <link> tag: {feed}")
         return feed
 
-    # 2. Probe common feed paths on the domain root
-    for path in _FEED_PATHS:
-        candidate = base + path
-        ok, final = _probe_url(candidate)
-        if ok:
-            print(f"[process_missed] Feed found via probe: {final or candidate}")
-            return final or candidate
+    # 2. Probe common feed paths on the domain root — all at once, so a dead domain
+    #    costs one timeout instead of len(_FEED_PATHS). The earliest path in
+    #    _FEED_PATHS order that answers as a feed wins, as in the serial loop.
+    candidates = [base + path for path in _FEED_PATHS]
+    ex = ThreadPoolExecutor(max_workers=len(candidates))
+    futures = [ex.submit(_probe_url, c) for c in candidates]
+    try:
+        pending = set(futures)
+        while pending:
+            _, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for candidate, fut in zip(candidates, futures):
+                if not fut.done():
+                    break  # an earlier-priority probe is still running
+                ok, final = fut.result()
+                if ok:
+                    print(f"[process_missed] Feed found via probe: {final or candidate}")
+                    return final or candidate
+    finally:
+        ex.shutdown(wait=False, cancel_futures=True)
 
     return ""
 
 
-def _domain_in_extra_rss(domain: str, extra_sources: List[Dict[str, Any]]) -> bool:
-    """Return True if this domain already has an entry in extra_rss_sources."""
-    for src in extra_sources:
-        if _domain(src.get("url") or "") == domain:
-            return True
-    return False
-
-
 def _make_extra_rss_source(feed_url: str, paper_url: str) -> Dict[str, Any]:
     """Build a source entry (compatible with rss_sources config format)."""
     parsed = urllib.parse.urlparse(feed_url)
@@ -299,21 +512,31 @@ _NOTION_API = "https://api.notion.com/v1/pages"
 _DEFAULT_NOTION_DB = "3165f58ea8c280498f72c770028aec0d"
 
 
+def _notion_headers(api_key: str) -> Dict[str, str]:
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Notion-Version": "2022-06-28",
+        "Content-Type": "application/json",
+    }
+
+
+def _notion_body(obj: Any) -> bytes:
+    """Serialized Notion request body; _notion_headers already sets Content-Type."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
 def _ensure_source_property(api_key: str, database_id: str) -> None:
     """Add a 'Source' select property to the database if it doesn't exist yet."""
-    payload = json.dumps({"properties": {"Source": {"select": {}}}}).encode("utf-8")
-    req = urllib.request.Request(
-        f"https://api.notion.com/v1/databases/{database_id}",
-        data=payload,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Notion-Version": "2022-06-28",
-            "Content-Type": "application/json",
-        },
-        method="PATCH",
-    )
     try:
-        urllib.request.urlopen(req, timeout=15)
+        with _NOTION_LIMIT:
+            _SESSION.patch(
+                f"https://api.notion.com/v1/databases/{database_id}",
+                data=_notion_body({"properties": {"Source": {"select": {}}}}),
+                headers=_notion_headers(api_key),
+                timeout=15,
+            )
     except Exception:
         pass
 
@@ -341,13 +564,16 @@ def create_notion_missed_stub(entry: Dict[str, Any], api_key: str, database_id:
     if kws:
         note_lines.append(f"🏷️ Keywords boosted: {', '.join(kws)}")
     note_text = "\n".join(note_lines)
+    # Notion caps each rich_text content at 2000 chars
+    title_clip = title[:2000]
+    note_clip  = note_text[:2000]
 
     children: List[Dict[str, Any]] = [
         {
             "object": "block", "type": "callout",
             "callout": {
                 "icon": {"type": "emoji", "emoji": "📬"},
-                "rich_text": [{"type": "text", "text": {"content": note_text[:2000]}}],
+                "rich_text": [{"type": "text", "text": {"content": note_clip}}],
                 "color": "blue_background",
             },
         },
@@ -371,28 +597,21 @@ def create_notion_missed_stub(entry: Dict[str, Any], api_key: str, database_id:
     body_data = {
         "parent": {"database_id": database_id},
         "properties": {
-            "Name":   {"title":     [{"text": {"content": title[:2000]}}]},
+            "Name":   {"title":     [{"text": {"content": title_clip}}]},
             "Date":   {"date":      {"start": date}},
-            "Note":   {"rich_text": [{"text": {"content": note_text[:2000]}}]},
+            "Note":   {"rich_text": [{"text": {"content": note_clip}}]},
             "Source": {"select":    {"name": "Missed Paper"}},
         },
         "children": children,
     }
 
-    payload = json.dumps(body_data).encode("utf-8")
-    req = urllib.request.Request(
-        _NOTION_API,
-        data=payload,
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Notion-Version": "2022-06-28",
-            "Content-Type": "application/json",
-        },
-        method="POST",
-    )
     try:
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
+        with _NOTION_LIMIT:
+            resp = _SESSION.post(
+                _NOTION_API, data=_notion_body(body_data), headers=_notion_headers(api_key), timeout=30
+            )
+        resp.raise_for_status()
+        result = resp.json()
         page_id = result.get("id", "")
         print(f"[process_missed] Notion stub created: {page_id[:8]}… for '{title[:60]}'")
         return page_id
@@ -427,34 +646,21 @@ def process_missed_papers() -> None:
     cfg: Dict[str, Any] = {}
     if CONFIG_FILE.exists():
         with open(CONFIG_FILE, encoding="utf-8") as f:
-            cfg = yaml.safe_load(f) or {}
+            cfg = yaml.load(f, Loader=_YamlLoader) or {}
 
-    # Load seen_ids
-    seen_ids: Set[str] = set()
-    if SEEN_FILE.exists():
-        try:
-            seen_ids = set(json.loads(SEEN_FILE.read_text(encoding="utf-8")))
-        except Exception:
-            pass
+    seen_ids = _load_seen_ids()
+
+    kw_cache: Dict[str, List[str]] = _load_json(KW_CACHE_FILE, {})
+    kw_cache_size = len(kw_cache)
 
     rss_domains    = _rss_domains(cfg)
-    excluded_terms = cfg.get("excluded_terms") or []
+    excluded_terms_lower = [t.lower() for t in (cfg.get("excluded_terms") or [])]
 
     # Load missed_papers.json
-    papers: List[Dict[str, Any]] = []
-    if MISSED_FILE.exists():
-        try:
-            papers = json.loads(MISSED_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            papers = []
+    papers: List[Dict[str, Any]] = _load_json(MISSED_FILE, [])
 
     # Load boosted_topics.json
-    boosted: List[str] = []
-    if BOOST_FILE.exists():
-        try:
-            boosted = json.loads(BOOST_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            boosted = []
+    boosted: List[str] = _load_json(BOOST_FILE, [])
 
     api_key      = os.environ.get("OPENROUTER_API_KEY", "")
     notion_key   = os.environ.get("NOTION_API_KEY", "")
@@ -464,15 +670,16 @@ def process_missed_papers() -> None:
         _ensure_source_property(notion_key, notion_db)
 
     # Load extra_rss_sources.json
-    extra_rss: List[Dict[str, Any]] = []
-    if EXTRA_RSS_FILE.exists():
-        try:
-            extra_rss = json.loads(EXTRA_RSS_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            pass
+    extra_rss: List[Dict[str, Any]] = _load_json(EXTRA_RSS_FILE, [])
+    # Domains that already have an entry in extra_rss_sources
+    extra_domains: Set[str] = {_domain(s.get("url") or "") for s in extra_rss}
 
     changed = False
     rss_changed = False
+    boosted_changed = False
+
+    # 1. Diagnose serially (cheap, local) and collect the entries that need network work
+    todo: List[Dict[str, Any]] = []
     for paper in papers:
         if paper.get("processed"):
             continue
@@ -486,44 +693,74 @@ def process_missed_papers() -> None:
         print(f"[process_missed] Processing: {title[:80]}")
 
         # Diagnose
-        diag = diagnose(paper, seen_ids, rss_domains, excluded_terms)
+        diag = diagnose(paper, seen_ids, rss_domains, excluded_terms_lower)
         paper["diagnosis"] = diag
         print(f"[process_missed] Diagnosis: {diag}")
-
-        # Extract keywords for low_ranking and source_not_in_rss entries
+        todo.append(paper)
+
+    # 2. Extract keywords for low_ranking and source_not_in_rss entries — all LLM calls
+    #    in flight at once; merged serially in paper order so boosted stays deterministic
+    kw_papers = [p for p in todo if p["diagnosis"] in ("low_ranking", "source_not_in_rss")]
+    kw_results: List[List[str]] = []
+    if kw_papers:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(kw_papers))) as pool:
+            kw_results = list(pool.map(
+                lambda p: extract_keywords_llm((p.get("title") or "").strip(), api_key, kw_cache),
+                kw_papers,
+            ))
+    kws_by_paper = {id(p): kws for p, kws in zip(kw_papers, kw_results)}
+
+    # 3. Try RSS feed discovery for source_not_in_rss — one probe run per new domain
+    discover_urls: Dict[str, str] = {}
+    for paper in todo:
+        url = (paper.get("url") or "").strip()
+        if paper["diagnosis"] == "source_not_in_rss" and url:
+            d = _domain(url)
+            if d and d not in discover_urls and d not in extra_domains:
+                discover_urls[d] = url
+    feeds_by_domain: Dict[str, str] = {}
+    if discover_urls:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(discover_urls))) as pool:
+            feeds_by_domain = dict(zip(discover_urls, pool.map(discover_rss_feed, discover_urls.values())))
+
+    for paper in todo:
         keywords_added: List[str] = []
-        if diag in ("low_ranking", "source_not_in_rss"):
-            new_kws = extract_keywords_llm(title, api_key)
-            boosted, keywords_added = _merge_keywords(boosted, new_kws)
+        if id(paper) in kws_by_paper:
+            boosted, keywords_added = _merge_keywords(boosted, kws_by_paper[id(paper)])
             if keywords_added:
+                boosted_changed = True
                 print(f"[process_missed] Added keywords: {keywords_added}")
 
-        # Try RSS feed discovery for source_not_in_rss
         rss_feed_found: str = ""
-        if diag == "source_not_in_rss":
-            url = (paper.get("url") or "").strip()
-            if url:
-                d = _domain(url)
-                if d and not _domain_in_extra_rss(d, extra_rss):
-                    feed_url = discover_rss_feed(url)
-                    if feed_url:
-                        src_entry = _make_extra_rss_source(feed_url, url)
-                        extra_rss.append(src_entry)
-                        rss_feed_found = feed_url
-                        rss_changed = True
-                        print(f"[process_missed] Saved new RSS source: {feed_url}")
-                    else:
-                        print(f"[process_missed] No RSS feed found for domain: {d}")
+        url = (paper.get("url") or "").strip()
+        d = _domain(url) if url else ""
+        if paper["diagnosis"] == "source_not_in_rss" and d in feeds_by_domain:
+            feed_url = feeds_by_domain.pop(d)  # first paper of the domain takes it
+            if feed_url:
+                src_entry = _make_extra_rss_source(feed_url, url)
+                extra_rss.append(src_entry)
+                extra_domains.add(_domain(feed_url))
+                rss_feed_found = feed_url
+                rss_changed = True
+                print(f"[process_missed] Saved new RSS source: {feed_url}")
+            else:
+                print(f"[process_missed] No RSS feed found for domain: {d}")
 
         paper["keywords_added"] = keywords_added
         paper["rss_feed_found"] = rss_feed_found
 
-            # Create Notion deep-dive stub (skip if already created or Notion not configured)
-        if notion_key and not paper.get("notion_page_id"):
-            page_id = create_notion_missed_stub(paper, notion_key, notion_db)
+    # 4. Create Notion deep-dive stubs (skip if already created or Notion not configured)
+    stub_papers = [p for p in todo if notion_key and not p.get("notion_page_id")]
+    if stub_papers:
+        with ThreadPoolExecutor(max_workers=min(NOTION_MAX_WORKERS, len(stub_papers))) as pool:
+            page_ids = list(pool.map(
+                lambda p: create_notion_missed_stub(p, notion_key, notion_db), stub_papers
+            ))
+        for paper, page_id in zip(stub_papers, page_ids):
             if page_id:
                 paper["notion_page_id"] = page_id
 
+    for paper in todo:
         paper["processed"] = True
         changed = True
 
@@ -532,10 +769,13 @@ def process_missed_papers() -> None:
         return
 
     # Write results
-    MISSED_FILE.write_text(json.dumps(papers, indent=2, ensure_ascii=False), encoding="utf-8")
-    BOOST_FILE.write_text(json.dumps(boosted, indent=2, ensure_ascii=False), encoding="utf-8")
+    _dump_json(MISSED_FILE, papers)
+    if boosted_changed:
+        _dump_json(BOOST_FILE, boosted)
+    if len(kw_cache) != kw_cache_size:
+        _dump_json(KW_CACHE_FILE, kw_cache)
     if rss_changed:
-        EXTRA_RSS_FILE.write_text(json.dumps(extra_rss, indent=2, ensure_ascii=False), encoding="utf-8")
+        _dump_json(EXTRA_RSS_FILE, extra_rss)
         print(f"[process_missed] extra_rss_sources now has {len(extra_rss)} source(s).")
     print(f"[process_missed] Done. boosted_topics now has {len(boosted)} keyword(s).")
 
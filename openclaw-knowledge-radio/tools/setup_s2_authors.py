@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import sys
 import time
 from pathlib import Path
@@ -33,6 +34,9 @@ OUTPUT     = STATE_DIR / "s2_author_ids.json"
 S2_BASE    = "https://api.semanticscholar.org/graph/v1"
 _DELAY     = 1.05
 
+# "David Baker (arXiv)" -> "David Baker"
+_SOURCE_AUTHOR_RE = re.compile(r"^(.+?)\s*\(")
+
 
 def _get(path: str, params: dict, api_key: str) -> dict | None:
     headers = {"x-api-key": api_key} if api_key else {}
@@ -98,13 +102,12 @@ def _collect_authors(cfg: dict) -> list[dict]:
             seen_names.add(name)
 
     # rss_sources with tag 'author' — extract name from source name like "David Baker (arXiv)"
-    import re
     for src in cfg.get("rss_sources", []):
         tags = src.get("tags") or []
         if "author" not in tags:
             continue
         raw = src.get("name", "")
-        m = re.match(r"^(.+?)\s*\(", raw)
+        m = _SOURCE_AUTHOR_RE.match(raw)
         name = (m.group(1) if m else raw).strip()
         if name and name not in seen_names:
             authors.append({"name": name, "institution": ""})
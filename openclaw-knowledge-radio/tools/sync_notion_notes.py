@@ -8,9 +8,23 @@ Runs via GitHub Actions whenever paper_notes.json changes.
 """
 import json
 import os
-import requests
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# tools/ runs as a script; put the package root on sys.path for shared src.utils helpers
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from src.utils.rate_limit import RateLimiter  # noqa: E402
+
 NOTION_API_KEY  = os.environ["NOTION_API_KEY"]
 DATABASE_ID     = os.environ.get("NOTION_DATABASE_ID", "3165f58ea8c280498f72c770028aec0d")
 
@@ -25,6 +39,40 @@ HEADERS = {
     "Content-Type": "application/json",
 }
 
+# One keep-alive pool for every Notion call; transient 429/502/503 on GETs are retried
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 502, 503],
+        # Idempotent methods only: re-sending a page-create POST after a 502 the
+        # server already processed would create a duplicate page
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+    ),
+))
+
+# Notion's public API allows ~3 requests/second; that many notes sync at once
+NOTION_MAX_WORKERS = 3
+_NOTION_LIMIT = RateLimiter(rate=NOTION_MAX_WORKERS, per=1.0)
+
+
+def _dumps(obj) -> bytes:
+    """Request body bytes (orjson when installed; HEADERS already sets Content-Type)."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def _notion(method: str, url: str, **kwargs) -> requests.Response:
+    """One rate-limited Notion API call on the shared session."""
+    if "json" in kwargs:
+        kwargs["data"] = _dumps(kwargs.pop("json"))
+    with _NOTION_LIMIT:
+        return _SESSION.request(method, url, headers=HEADERS, timeout=30, **kwargs)
+
 
 def _load_json(path: Path, default):
     if path.exists():
@@ -44,39 +92,38 @@ def _note_fields(val) -> tuple[str, str, str]:
     return "", "", ""
 
 
-def _created_entry(entry) -> tuple[str, str]:
-    """Return (page_id, saved_note) from either old string or new dict format."""
+def _created_entry(entry) -> tuple[str, str, str]:
+    """Return (page_id, saved_note, callout_id) from either old string or new dict format."""
     if isinstance(entry, str):
-        return entry, ""
+        return entry, "", ""
     if isinstance(entry, dict):
-        return entry.get("page_id", ""), entry.get("note", "")
-    return "", ""
+        return entry.get("page_id", ""), entry.get("note", ""), entry.get("callout_id", "")
+    return "", "", ""
 
 
-def _find_item_meta(date: str, url: str) -> tuple[str, str]:
-    """Look up paper title and source from episode_items.json."""
+def _item_meta_for_date(date: str) -> dict[str, tuple[str, str]]:
+    """Map url -> (title, source) from one date's episode_items.json (first entry wins)."""
     items_file = OUTPUT_DIR / date / "episode_items.json"
+    meta: dict[str, tuple[str, str]] = {}
     if not items_file.exists():
-        return "", ""
+        return meta
     try:
         raw = json.loads(items_file.read_text(encoding="utf-8"))
         items = raw.get("items", raw) if isinstance(raw, dict) else raw
         for item in items:
-            if item.get("url") == url:
-                return item.get("title", ""), item.get("source", "")
+            meta.setdefault(item.get("url"), (item.get("title", ""), item.get("source", "")))
     except Exception:
         pass
-    return "", ""
+    return meta
 
 
 def _ensure_source_property() -> None:
     """Add a 'Source' select property to the database if it doesn't exist yet."""
     try:
-        requests.patch(
+        _notion(
+            "PATCH",
             f"https://api.notion.com/v1/databases/{DATABASE_ID}",
             json={"properties": {"Source": {"select": {}}}},
-            headers=HEADERS,
-            timeout=30,
         )
     except Exception:
         pass
@@ -85,11 +132,10 @@ def _ensure_source_property() -> None:
 def _find_existing_notion_page(title: str) -> str | None:
     """Query Notion for a page with this exact title. Returns page_id or None."""
     try:
-        r = requests.post(
+        r = _notion(
+            "POST",
             f"https://api.notion.com/v1/databases/{DATABASE_ID}/query",
             json={"filter": {"property": "Name", "title": {"equals": title}}},
-            headers=HEADERS,
-            timeout=30,
         )
         if r.ok:
             results = r.json().get("results", [])
@@ -101,12 +147,14 @@ def _find_existing_notion_page(title: str) -> str | None:
 
 
 def create_notion_page(title: str, url: str, date: str, source: str, note: str) -> str:
+    title_clip = title[:2000]
+    note_clip  = note[:2000]  # Notion caps each rich_text content at 2000 chars
     body = {
         "parent": {"database_id": DATABASE_ID},
         "properties": {
-            "Name":   {"title":     [{"text": {"content": title[:2000]}}]},
+            "Name":   {"title":     [{"text": {"content": title_clip}}]},
             "Date":   {"date":      {"start": date}},
-            "Note":   {"rich_text": [{"text": {"content": note[:2000]}}]},
+            "Note":   {"rich_text": [{"text": {"content": note_clip}}]},
             "Source": {"select":    {"name": "Daily Note"}},
         },
         "children": [
@@ -115,7 +163,7 @@ def create_notion_page(title: str, url: str, date: str, source: str, note: str)
                 "object": "block", "type": "callout",
                 "callout": {
                     "icon": {"type": "emoji", "emoji": "✏️"},
-                    "rich_text": [{"type": "text", "text": {"content": note[:2000]}}],
+                    "rich_text": [{"type": "text", "text": {"content": note_clip}}],
                     "color": "green_background",
                 },
             },
@@ -144,40 +192,81 @@ def create_notion_page(title: str, url: str, date: str, source: str, note: str)
             },
         ],
     }
-    r = requests.post("https://api.notion.com/v1/pages", json=body, headers=HEADERS, timeout=30)
+    r = _notion("POST", "https://api.notion.com/v1/pages", json=body)
     r.raise_for_status()
     return r.json()["id"]
 
 
-def update_notion_page(page_id: str, note: str) -> None:
-    """Update the Note property and the green callout block on an existing page."""
+def _find_callout_id(page_id: str) -> str:
+    """ID of the first callout block on the page, or "" if it has none."""
+    r = _notion("GET", f"https://api.notion.com/v1/blocks/{page_id}/children")
+    r.raise_for_status()
+    for block in r.json().get("results", []):
+        if block.get("type") == "callout":
+            return block["id"]
+    return ""
+
+
+def update_notion_page(page_id: str, note: str, callout_id: str = "") -> str:
+    """
+    Update the Note property and the green callout block on an existing page.
+    callout_id (cached from an earlier update) skips listing the page's
+    children; returns the callout ID used, "" if the page has none.
+    """
+    note_clip = note[:2000]
     # 1. Update the Note database property
-    r = requests.patch(
+    r = _notion(
+        "PATCH",
         f"https://api.notion.com/v1/pages/{page_id}",
-        json={"properties": {"Note": {"rich_text": [{"text": {"content": note[:2000]}}]}}},
-        headers=HEADERS,
-        timeout=30,
+        json={"properties": {"Note": {"rich_text": [{"text": {"content": note_clip}}]}}},
     )
     r.raise_for_status()
 
-    # 2. Find the callout block (first child) and update its text
-    r2 = requests.get(
-        f"https://api.notion.com/v1/blocks/{page_id}/children",
-        headers=HEADERS,
-        timeout=30,
-    )
-    r2.raise_for_status()
-    blocks = r2.json().get("results", [])
-    for block in blocks:
-        if block.get("type") == "callout":
-            block_id = block["id"]
-            requests.patch(
-                f"https://api.notion.com/v1/blocks/{block_id}",
-                json={"callout": {"rich_text": [{"type": "text", "text": {"content": note[:2000]}}]}},
-                headers=HEADERS,
-                timeout=30,
-            ).raise_for_status()
-            break
+    # 2. Update the callout block's text, finding it only when not cached
+    callout = {"callout": {"rich_text": [{"type": "text", "text": {"content": note_clip}}]}}
+    if callout_id:
+        r2 = _notion("PATCH", f"https://api.notion.com/v1/blocks/{callout_id}", json=callout)
+        if r2.status_code != 404:
+            r2.raise_for_status()
+            return callout_id
+        # Cached block was deleted on the Notion side; look it up again
+    callout_id = _find_callout_id(page_id)
+    if callout_id:
+        _notion(
+            "PATCH", f"https://api.notion.com/v1/blocks/{callout_id}", json=callout
+        ).raise_for_status()
+    return callout_id
+
+
+def _sync_one(job: tuple) -> tuple[dict | None, str, str]:
+    """
+    Run the Notion calls for one changed or new note.
+    Returns (new notion_created entry or None, log line, outcome).
+    """
+    url, date, title, source, note_text, page_id, callout_id = job
+    if page_id:
+        # Note changed: update the existing Notion page
+        try:
+            callout_id = update_notion_page(page_id, note_text, callout_id)
+            entry = {"page_id": page_id, "note": note_text}
+            if callout_id:
+                entry["callout_id"] = callout_id
+            return entry, f"↺ Updated: {title[:70]}", "updated"
+        except Exception as e:
+            return None, f"✗ Failed update for {url[:60]}: {e}", "failed"
+    # New note: check Notion first (guards against notion_created.json being stale)
+    existing_id = _find_existing_notion_page(title)
+    if existing_id:
+        return (
+            {"page_id": existing_id, "note": note_text},
+            f"↩ Already in Notion (skipped duplicate): {title[:70]}",
+            "skipped",
+        )
+    try:
+        page_id = create_notion_page(title, url, date, source, note_text)
+        return {"page_id": page_id, "note": note_text}, f"✓ Created: {title[:70]}", "created"
+    except Exception as e:
+        return None, f"✗ Failed for {url[:60]}: {e}", "failed"
 
 
 def main():
@@ -185,9 +274,16 @@ def main():
     created = _load_json(CREATED_FILE, {})
 
     _ensure_source_property()
-    new_pages = 0
-    updated   = 0
+
+    # Plan every Notion operation first, then run them NOTION_MAX_WORKERS at a time
+    keys: list[str] = []
+    jobs: list[tuple] = []
+    # New notes whose title repeats an earlier new note wait for it, so the
+    # duplicate check in _sync_one can see the page it created
+    later: list[int] = []
+    new_titles: set[str] = set()
     for date, date_notes in sorted(notes.items()):
+        item_meta = _item_meta_for_date(date)  # one read per date, not per note
         for url, val in date_notes.items():
             key = f"{date}|{url}"
 
@@ -196,37 +292,40 @@ def main():
                 continue
 
             # Prefer metadata from episode_items.json (more reliable)
-            ep_title, ep_source = _find_item_meta(date, url)
+            ep_title, ep_source = item_meta.get(url, ("", ""))
             title  = ep_title  or saved_title  or url
             source = ep_source or saved_source or ""
 
+            page_id = callout_id = ""
             if key in created:
-                page_id, prev_note = _created_entry(created[key])
+                page_id, prev_note, callout_id = _created_entry(created[key])
                 if note_text == prev_note:
                     continue  # unchanged — nothing to do
-                # Note changed: update the existing Notion page
-                try:
-                    update_notion_page(page_id, note_text)
-                    created[key] = {"page_id": page_id, "note": note_text}
-                    print(f"↺ Updated: {title[:70]}")
-                    updated += 1
-                except Exception as e:
-                    print(f"✗ Failed update for {url[:60]}: {e}")
+            elif title in new_titles:
+                later.append(len(jobs))
             else:
-                # New note: check Notion first (guards against notion_created.json being stale)
-                existing_id = _find_existing_notion_page(title)
-                if existing_id:
-                    print(f"↩ Already in Notion (skipped duplicate): {title[:70]}")
-                    created[key] = {"page_id": existing_id, "note": note_text}
-                    continue
-                try:
-                    page_id = create_notion_page(title, url, date, source, note_text)
-                    created[key] = {"page_id": page_id, "note": note_text}
-                    print(f"✓ Created: {title[:70]}")
-                    new_pages += 1
-                except Exception as e:
-                    print(f"✗ Failed for {url[:60]}: {e}")
+                new_titles.add(title)
+            keys.append(key)
+            jobs.append((url, date, title, source, note_text, page_id, callout_id))
 
+    deferred = set(later)
+    first = [i for i in range(len(jobs)) if i not in deferred]
+    results: dict[int, tuple] = {}
+    if first:
+        with ThreadPoolExecutor(max_workers=min(NOTION_MAX_WORKERS, len(first))) as pool:
+            results.update(zip(first, pool.map(_sync_one, [jobs[i] for i in first])))
+    for i in later:
+        results[i] = _sync_one(jobs[i])
+
+    new_pages = 0
+    updated   = 0
+    for i, key in enumerate(keys):
+        entry, line, outcome = results[i]
+        print(line)
+        if entry:
+            created[key] = entry
+        new_pages += outcome == "created"
+        updated   += outcome == "updated"
     CREATED_FILE.write_text(
         json.dumps(created, indent=2, ensure_ascii=False),
         encoding="utf-8",